@@ -198,9 +198,10 @@ def get_jobs(args: ReportseffParameters) -> tuple[str, int]:
         debug=args.debug,
     )
     entry = None
+    process_entry = job_collection.process_entry
     try:
         for entry in db_output:
-            job_collection.process_entry(entry, add_job=add_jobs)
+            process_entry(entry, add_job=add_jobs)
     except Exception:
         click.echo(f"Error processing entry: {entry}", err=True)
         raise
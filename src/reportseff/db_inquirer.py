@@ -279,8 +279,8 @@ class SacctInquirer(BaseInquirer):
         if debug_cmd is not None:
             debug_cmd("\n".join(line.replace("\n", "\\n") for line in lines))
 
-        sacct_split = re.compile(r"\^\|\^")
-        result = [dict(zip(columns, sacct_split.split(line))) for line in lines if line]
+        # the delimiter is literal, str.split avoids the regex engine per row
+        result = [dict(zip(columns, line.split("^|^"))) for line in lines if line]
 
         # Sometimes the main job has a different state than the sub jobs
         # e.g. timeouts have a state of canceled for the batch jobs.
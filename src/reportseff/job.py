@@ -6,6 +6,7 @@ import base64
 import gzip
 import json
 import re
+import sys
 from datetime import timedelta
 from typing import Any, Generator
 
@@ -47,6 +48,25 @@ ADMIN_COMMENT_MIN_LENGTH = 10
 class Job:
     """Representation of scheduler job."""
 
+    # avoid a per-instance __dict__, collections can hold many array tasks
+    __slots__ = (
+        "job",
+        "jobid",
+        "filename",
+        "stepmem",
+        "totalmem",
+        "time",
+        "time_eff",
+        "cpu",
+        "state",
+        "mem_eff",
+        "gpu",
+        "gpu_mem",
+        "energy",
+        "other_entries",
+        "comment_data",
+    )
+
     def __init__(self, job: str, jobid: str, filename: str | None) -> None:
         """Initialize new job.
 
@@ -85,7 +105,9 @@ class Job:
         if not isinstance(other, Job):
             return False
 
-        return self.__dict__ == other.__dict__
+        return all(
+            getattr(self, attr) == getattr(other, attr) for attr in self.__slots__
+        )
 
     def __repr__(self) -> str:
         """Job representation.
@@ -102,7 +124,8 @@ class Job:
             entry: the db_inquirer entry for the matching job
         """
         if "." not in entry["JobID"]:
-            self.state = entry["State"].split()[0]
+            # few distinct states repeat across many jobs
+            self.state = sys.intern(entry["State"].split()[0])
 
         if self.state == "PENDING":
             self._cache_entries()
@@ -2,7 +2,10 @@
 
 from __future__ import annotations
 
+import os
 import re
+import sys
+from functools import lru_cache
 from pathlib import Path
 from typing import TYPE_CHECKING
 
@@ -11,52 +14,63 @@ from .job import Job
 if TYPE_CHECKING:  # pragma: no cover
     from .output_renderer import OutputRenderer
 
+#: Default columns requested from the inquirer
+COLUMNS = (
+    "JobIDRaw",
+    "JobID",
+    "State",
+    "AllocCPUS",
+    "TotalCPU",
+    "Elapsed",
+    "Timelimit",
+    "REQMEM",
+    "MaxRSS",
+    "NNodes",
+    "NTasks",
+    "Partition",
+)
+#: Regex for default slurm output files, e.g. slurm-123_4.out, used with fullmatch
+JOB_FILE_RE = re.compile(r".*?[_-](?P<jobid>(?P<job>[0-9]+)(_[0-9]+)?)(\.out)?")
+#: Search for any digit, every output file pattern requires a numeric jobid
+HAS_DIGIT_RE = re.compile(r"[0-9]")
+#: Characters removed from a jobid to sort it as a number
+NON_NUMERIC_RE = re.compile(r"[^0-9.]")
+#: Regex for job ids provided by the user, used with fullmatch
+JOB_RE = re.compile(r"(?P<jobid>(?P<job>[0-9]+)(_[][\-0-9]+)?)")
+
 
 class JobCollection:
     """A group of jobs."""
 
     def __init__(self) -> None:
         """Create a new job collection with default options."""
-        self.columns = [
-            "JobIDRaw",
-            "JobID",
-            "State",
-            "AllocCPUS",
-            "TotalCPU",
-            "Elapsed",
-            "Timelimit",
-            "REQMEM",
-            "MaxRSS",
-            "NNodes",
-            "NTasks",
-            "Partition",
-        ]
-
-        self.job_file_regex = re.compile(
-            r"^.*?[_-](?P<jobid>(?P<job>[0-9]+)(_[0-9]+)?)(\.out)?$"
-        )
-        self.job_regex = re.compile(r"^(?P<jobid>(?P<job>[0-9]+)(_[][\-0-9]+)?)$")
+        self.job_file_regex = JOB_FILE_RE
+        self._match_file = JOB_FILE_RE.fullmatch
+        self.job_regex = JOB_RE
 
         self.jobs: dict[str, Job] = {}
         self.renderer: OutputRenderer | None = None
         self.dir_name: Path | None = None
         self.partition_timelimits: dict = {}
+        # modified time of output files by directory and name, None if missing
+        self._mtime_cache: dict[tuple[Path | None, str], float | None] = {}
 
-    def get_columns(self) -> list[str]:
-        """The list of columns requested from inquirer.
+    def get_columns(self) -> tuple[str, ...]:
+        """The columns requested from inquirer.
 
         Returns:
             The current columns of this collection.
         """
-        return self.columns
+        return COLUMNS
 
     def get_jobs(self) -> list[str]:
         """List of jobs to get from inquirer.
 
         Returns:
-            job names as a sorted list
+            unique job names in the order they were added
         """
-        return sorted({job.job for job in self.jobs.values()})
+        # dict keys deduplicate in C and keep insertion order
+        return list(dict.fromkeys(job.job for job in self.jobs.values()))
 
     def set_out_dir(self, directory: str) -> None:
         """Set this collection's directory to try parsing out jobs from output files.
@@ -72,21 +86,30 @@ class JobCollection:
             ValueError: if the directory contains no files
             ValueError: if the directory contains no valid files
         """
-        # set and validate working directory to full path
-        working_directory = Path(directory).resolve() if directory else Path.cwd()
+        self._mtime_cache = {}
+        # set and validate working directory to full path, files are only joined
+        # to it so absolute avoids resolving symlinks through every component
+        working_directory = Path(directory).absolute() if directory else Path.cwd()
 
         if not working_directory.exists():
             msg = f"{working_directory} does not exist!"
             raise ValueError(msg)
 
-        # get files from directory
-        files = [file for file in working_directory.iterdir() if file.is_file()]
+        # get files from directory, scandir caches the file type of each entry
+        with os.scandir(working_directory) as entries:
+            files = [entry for entry in entries if entry.is_file()]
         if len(files) == 0:
             msg = f"{working_directory} contains no files!"
             raise ValueError(msg)
 
-        for file in files:
-            self.process_seff_file(file.name)
+        # record modified times while listing to avoid stats when sorting
+        for entry in files:
+            if self.process_seff_file(entry.name):
+                key = (working_directory, entry.name)
+                try:
+                    self._mtime_cache[key] = entry.stat().st_mtime
+                except OSError:
+                    self._mtime_cache[key] = None
 
         if len(self.jobs) == 0:
             msg = (
@@ -109,6 +132,7 @@ class JobCollection:
         Raises:
             ValueError: if no valid jobs are provided
         """
+        self._mtime_cache = {}
         if jobs == ():
             # look in current directory for slurm outputs
             self.set_out_dir("")
@@ -117,7 +141,11 @@ class JobCollection:
             self.set_out_dir(jobs[0])
             return
         for job_id in jobs:
-            match = self.job_regex.match(job_id)
+            # plain job numbers are the common case, skip the regex for them
+            if job_id.isascii() and job_id.isdigit():
+                self.add_job(job_id, job_id)
+                continue
+            match = self.job_regex.fullmatch(job_id)
 
             if match:
                 self.add_job(match.group("job"), match.group("jobid"))
@@ -128,15 +156,23 @@ class JobCollection:
             msg = "No valid jobs provided!"
             raise ValueError(msg)
 
-    def process_seff_file(self, filename: str) -> None:
+    def process_seff_file(self, filename: str) -> bool:
         """Try to parse out job information from the supplied filename.
 
         Args:
             filename: the filename to try and match
+
+        Returns:
+            True if the filename matched and the job was added
         """
-        match = self.job_file_regex.match(filename)
+        # most non-output files have no digits, skip the full pattern for those
+        if not HAS_DIGIT_RE.search(filename):
+            return False
+        match = self._match_file(filename)
         if match:
             self.add_job(match.group("job"), match.group("jobid"), filename)
+            return True
+        return False
 
     def set_custom_seff_format(self, filename_pattern: str) -> None:
         """Set the slurm output file parser to a custom value.
@@ -147,42 +183,9 @@ class JobCollection:
         Raises:
             ValueError: the jobid cannot be determined from the provided pattern
         """
-        pattern = re.escape(filename_pattern)
-        # if %j is present, use that for jobid and job
-        if "%j" in pattern:
-            pattern = pattern.replace("%j", r"(?P<jobid>(?P<job>[0-9]+))")
-        # if %a is present, it must follow %A to match expected slurm outputs
-        elif "%A_%a" in pattern:
-            pattern = pattern.replace(
-                "%A_%a",
-                r"(?P<jobid>(?P<job>[0-9]+)_[0-9]+)",
-            )
-        # if %A alone is present, use that for jobid and job
-        elif "%A" in pattern:
-            pattern = pattern.replace(
-                "%A",
-                r"(?P<jobid>(?P<job>[0-9]+))",
-            )
-        else:
-            msg = (
-                f"Unable to determine jobid from {filename_pattern}. "
-                "Pattern should include one of ('%j', '%A', '%A_%a')"
-            )
-            raise ValueError(msg)
-
-        tokens = re.split(r"(%[^%])", pattern)
-        # combine sequential tokens
-        processed_tokens = [""]
-        for token in tokens:
-            if not token:
-                continue
-            if token.startswith("%") and processed_tokens[-1].startswith(".*"):
-                continue
-            if token.startswith("%"):
-                processed_tokens.append(".*")
-            else:
-                processed_tokens.append(token)
-        self.job_file_regex = re.compile("^" + "".join(processed_tokens) + "$")
+        self.job_file_regex = seff_format_to_regex(filename_pattern)
+        # bound once, process_seff_file is called for every file in a directory
+        self._match_file = self.job_file_regex.fullmatch
 
     def add_job(self, job: str, jobid: str, filename: str | None = None) -> None:
         """Add a job to the collection.
@@ -192,7 +195,9 @@ class JobCollection:
             jobid: equal to the job unless it is an array job
             filename: the filename of the out file this job is derived from
         """
-        self.jobs[jobid] = Job(job, jobid, filename)
+        # interned ids are shared by the many rows and steps of each job
+        jobid = sys.intern(jobid)
+        self.jobs[jobid] = Job(sys.intern(job), jobid, filename)
 
     def process_entry(self, entry: dict, *, add_job: bool = False) -> None:
         """Update the jobs collection with information from the provided entry.
@@ -201,12 +206,14 @@ class JobCollection:
             entry: the account entry from a db inquirer
             add_job: if true, will add the job to the collection if it doesn't exist
         """
-        job_id = entry["JobID"].split(".")[0]
-        job_id_raw = entry["JobIDRaw"].split(".")[0]
-        if job_id not in self.jobs:
-            match = self.job_regex.match(job_id)
-            # job is in jobs
-            if match and (match.group("job") in self.jobs or add_job):
+        job_id = sys.intern(entry["JobID"].partition(".")[0])
+        job_id_raw = entry["JobIDRaw"].partition(".")[0]
+        # most rows are steps of a job already in the collection
+        job = self.jobs.get(job_id)
+        if job is None:
+            match = self.job_regex.fullmatch(job_id)
+            # job is in jobs, or is added without checking when requested
+            if match and (add_job or match.group("job") in self.jobs):
                 self.add_job(match.group("job"), job_id)
             # check if the job_id is an array job
             elif job_id_raw in self.jobs:
@@ -214,17 +221,19 @@ class JobCollection:
                 self.add_job(old_job.job, job_id, old_job.filename)
             else:
                 return
+            job = self.jobs[job_id]
+
+        # few distinct partitions repeat across many rows
+        if "Partition" in entry:
+            entry["Partition"] = sys.intern(entry["Partition"])
 
         # handle partition limit for timelimit
-        if (
-            "Timelimit" in entry
-            and entry["Timelimit"] == "Partition_Limit"
-            and "Partition" in entry
-            and entry["Partition"] in self.partition_timelimits
-        ):
-            entry["Timelimit"] = self.partition_timelimits[entry["Partition"]]
+        if entry.get("Timelimit") == "Partition_Limit":
+            entry["Timelimit"] = self.partition_timelimits.get(
+                entry.get("Partition"), "Partition_Limit"
+            )
 
-        self.jobs[job_id].update(entry)
+        job.update(entry)
 
     def get_sorted_jobs(self, *, change_sort: bool) -> list[Job]:
         """Sort the jobs.
@@ -240,31 +249,114 @@ class JobCollection:
         """
 
         def get_time(job: Job) -> float:
+            if job.filename:
+                mtime = self._get_mtime(job.filename)
+                if mtime is not None:
+                    return mtime
             # handle None and '', use numeric representation of name
-            idnum = float(re.sub("[^0-9.]", "", job.jobid.replace("_", ".")))
-            file = job.filename
-            if file:
-                path = Path(file)
-                if self.dir_name:
-                    path = self.dir_name / file
-                if path.exists():
-                    return path.stat().st_mtime
-            return idnum
+            return float(NON_NUMERIC_RE.sub("", job.jobid.replace("_", ".")))
 
+        # keys are computed once per job, shorter names first gives 1, 2, 13
         def get_file_name(job: Job) -> tuple[bool, int, str]:
-            file = Path(job.name())
-            file = self.dir_name / file if self.dir_name else file
-            return (not file.exists(), len(str(file)), str(file))
+            name = job.name()
+            file = str(self._get_path(name))
+            return (self._get_mtime(name) is None, len(file), file)
 
         if change_sort:
             return sorted(self.jobs.values(), key=get_time, reverse=True)
 
         return sorted(self.jobs.values(), key=get_file_name)
 
+    def _get_path(self, filename: str) -> Path:
+        """Location of the filename, relative to the output directory if set.
+
+        Args:
+            filename: the output file name
+
+        Returns:
+            The path to the file
+        """
+        return self.dir_name / filename if self.dir_name else Path(filename)
+
+    def _get_mtime(self, filename: str) -> float | None:
+        """Modified time of the output file, cached by path.
+
+        Args:
+            filename: the output file name
+
+        Returns:
+            The modified time or None if the file cannot be accessed
+        """
+        # key on the directory and name to skip building paths on cache hits
+        key = (self.dir_name, filename)
+        if key not in self._mtime_cache:
+            try:
+                self._mtime_cache[key] = self._get_path(filename).stat().st_mtime
+            except OSError:
+                self._mtime_cache[key] = None
+        return self._mtime_cache[key]
+
     def set_partition_limits(self, limits: dict) -> None:
         """Set partition limits from db inquirer.
 
         Args:
             limits: dict of partition to partition timelimit
         """
-        self.partition_timelimits = limits
+        # interned to match the interned Partition of each entry
+        self.partition_timelimits = {
+            sys.intern(partition): limit for partition, limit in limits.items()
+        }
+
+
+@lru_cache(maxsize=32)
+def seff_format_to_regex(filename_pattern: str) -> re.Pattern:
+    """Convert a slurm output file pattern to a regex matching job ids.
+
+    Results are cached as the same pattern is typically requested repeatedly.
+
+    Args:
+        filename_pattern: the pattern passed to sbatch
+
+    Returns:
+        The compiled regex with job and jobid groups, to use with fullmatch
+
+    Raises:
+        ValueError: the jobid cannot be determined from the provided pattern
+    """
+    pattern = re.escape(filename_pattern)
+    # if %j is present, use that for jobid and job
+    if "%j" in pattern:
+        pattern = pattern.replace("%j", r"(?P<jobid>(?P<job>[0-9]+))")
+    # if %a is present, it must follow %A to match expected slurm outputs
+    elif "%A_%a" in pattern:
+        pattern = pattern.replace(
+            "%A_%a",
+            r"(?P<jobid>(?P<job>[0-9]+)_[0-9]+)",
+        )
+    # if %A alone is present, use that for jobid and job
+    elif "%A" in pattern:
+        pattern = pattern.replace(
+            "%A",
+            r"(?P<jobid>(?P<job>[0-9]+))",
+        )
+    else:
+        msg = (
+            f"Unable to determine jobid from {filename_pattern}. "
+            "Pattern should include one of ('%j', '%A', '%A_%a')"
+        )
+        raise ValueError(msg)
+
+    tokens = re.split(r"(%[^%])", pattern)
+    # combine sequential tokens
+    processed_tokens = [""]
+    for token in tokens:
+        if not token:
+            continue
+        if token.startswith("%") and processed_tokens[-1].startswith(".*"):
+            continue
+        if token.startswith("%"):
+            processed_tokens.append(".*")
+        else:
+            processed_tokens.append(token)
+    # anchoring is left to fullmatch
+    return re.compile("".join(processed_tokens))
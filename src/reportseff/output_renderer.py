@@ -305,17 +305,15 @@ class ColumnFormatter:
         if self.width is not None:
             return
 
-        self.width = len(self.title)
-        if len(jobs) > 0:
-            if node:
-                width = max(
-                    len(str(entry))
-                    for job in jobs
-                    for entry in job.get_node_entries(self.title, gpu=gpu)
-                )
-            else:
-                width = max(len(str(job.get_entry(self.title))) for job in jobs)
-            self.width = max(self.width, width)
+        title = self.title
+        if node:
+            entries = (
+                entry for job in jobs for entry in job.get_node_entries(title, gpu=gpu)
+            )
+        else:
+            entries = (job.get_entry(title) for job in jobs)
+        # measure the column in one pass, str and len run through map in C
+        self.width = max(len(title), max(map(len, map(str, entries)), default=0))
 
         self.width += 2  # add some boarder
 
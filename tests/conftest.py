@@ -3,6 +3,7 @@
 import base64
 import gzip
 import json
+from types import MappingProxyType
 
 import pytest
 
@@ -20,47 +21,53 @@ def get_jobstats():
     return to_comment
 
 
-def to_sacct_dict(sacct_line: str) -> dict:
-    """Convert debug print statement to dictionary like from sacct."""
-    columns = (
-        "AdminComment",
-        "AllocCPUS",
-        "Elapsed",
-        "JobID",
-        "JobIDRaw",
-        "MaxRSS",
-        "NNodes",
-        "REQMEM",
-        "State",
-        "Timelimit",
-        "TotalCPU",
-        "NTasks",
-    )
-    return dict(zip(columns, sacct_line.split("|")))
+_SACCT_COLUMNS = (
+    "AdminComment",
+    "AllocCPUS",
+    "Elapsed",
+    "JobID",
+    "JobIDRaw",
+    "MaxRSS",
+    "NNodes",
+    "REQMEM",
+    "State",
+    "Timelimit",
+    "TotalCPU",
+    "NTasks",
+)
 
 
-@pytest.fixture()
-def single_core():
-    """Single core 8206163."""
-    comment = to_comment(
-        {
-            "gpus": False,
-            "nodes": {
-                "tiger-h26c1n19": {
-                    "cpus": 1,
-                    "total_memory": 16106127360,
-                    "total_time": 54515.3,
-                    "used_memory": 582283264,
-                }
-            },
-            "total_time": 54677,
-        }
-    )
-
-    # sacct info is from another job!
-    return [
+def to_sacct_dict(sacct_line: str) -> dict:
+    """Convert debug print statement to dictionary like from sacct."""
+    return dict(zip(_SACCT_COLUMNS, sacct_line.split("|", len(_SACCT_COLUMNS) - 1)))
+
+
+def freeze_entries(entries: list) -> tuple:
+    """Wrap sacct entries as read-only mappings so shared fixtures can't change."""
+    return tuple(MappingProxyType(entry) for entry in entries)
+
+
+# single_core, multi_node, single_gpu, multi_gpu, multi_node_multi_gpu and
+# short_job are session scoped and share their frozen entries between tests
+_SINGLE_CORE_COMMENT = to_comment(
+    {
+        "gpus": False,
+        "nodes": {
+            "tiger-h26c1n19": {
+                "cpus": 1,
+                "total_memory": 16106127360,
+                "total_time": 54515.3,
+                "used_memory": 582283264,
+            }
+        },
+        "total_time": 54677,
+    }
+)
+# sacct info is from another job!
+_SINGLE_CORE_LINES = freeze_entries(
+    [
         to_sacct_dict(
-            f"{comment}|2|02:14:11|39889258_1426|39895850||1|8G|COMPLETED|02:55:00|03:43:27"
+            f"{_SINGLE_CORE_COMMENT}|2|02:14:11|39889258_1426|39895850||1|8G|COMPLETED|02:55:00|03:43:27"
         ),
         to_sacct_dict(
             "|2|02:14:11|39889258_1426.batch|39895850.batch|4224K|1||COMPLETED||00:00.081"
@@ -72,47 +79,51 @@ def single_core():
             "|2|02:14:11|39889258_1426.0|39895850.0|3501608K|1||COMPLETED||03:43:27"
         ),
     ]
+)
 
 
-@pytest.fixture()
-def multi_node():
-    """Multiple nodes with 20 cpus, 80 GB, 9 minutes 8205048."""
-    comment = to_comment(
-        {
-            "gpus": False,
-            "nodes": {
-                "tiger-h19c1n15": {
-                    "cpus": 20,
-                    "total_memory": 83886080000,
-                    "total_time": 542.0,
-                    "used_memory": 3790352384,
-                },
-                "tiger-h26c2n13": {
-                    "cpus": 20,
-                    "total_memory": 83886080000,
-                    "total_time": 0.0,
-                    "used_memory": 0,
-                },
-                "tiger-i26c2n11": {
-                    "cpus": 20,
-                    "total_memory": 83886080000,
-                    "total_time": 0.0,
-                    "used_memory": 0,
-                },
-                "tiger-i26c2n15": {
-                    "cpus": 20,
-                    "total_memory": 83886080000,
-                    "total_time": 0.0,
-                    "used_memory": 0,
-                },
+@pytest.fixture(scope="session")
+def single_core():
+    """Single core 8206163."""
+    return _SINGLE_CORE_LINES
+
+
+_MULTI_NODE_COMMENT = to_comment(
+    {
+        "gpus": False,
+        "nodes": {
+            "tiger-h19c1n15": {
+                "cpus": 20,
+                "total_memory": 83886080000,
+                "total_time": 542.0,
+                "used_memory": 3790352384,
             },
-            "total_time": 146,
-        }
-    )
-
-    return [
+            "tiger-h26c2n13": {
+                "cpus": 20,
+                "total_memory": 83886080000,
+                "total_time": 0.0,
+                "used_memory": 0,
+            },
+            "tiger-i26c2n11": {
+                "cpus": 20,
+                "total_memory": 83886080000,
+                "total_time": 0.0,
+                "used_memory": 0,
+            },
+            "tiger-i26c2n15": {
+                "cpus": 20,
+                "total_memory": 83886080000,
+                "total_time": 0.0,
+                "used_memory": 0,
+            },
+        },
+        "total_time": 146,
+    }
+)
+_MULTI_NODE_LINES = freeze_entries(
+    [
         to_sacct_dict(
-            f"{comment}|80|00:02:26|8205048|8205048||4|312.50G|COMPLETED|01:00:00|16:01.272"
+            f"{_MULTI_NODE_COMMENT}|80|00:02:26|8205048|8205048||4|312.50G|COMPLETED|01:00:00|16:01.272"
         ),
         to_sacct_dict(
             "|20|00:02:26|8205048.batch|8205048.batch|1764224K|1||COMPLETED||16:01.268"
@@ -121,32 +132,36 @@ def multi_node():
             "|80|00:02:26|8205048.extern|8205048.extern|0|4||COMPLETED||00:00.004"
         ),
     ]
+)
 
 
-@pytest.fixture()
-def single_gpu():
-    """One gpu, used all 16 GB, 30% eff 8197399."""
-    comment = to_comment(
-        {
-            "gpus": True,
-            "nodes": {
-                "tiger-i23g14": {
-                    "cpus": 1,
-                    "gpu_total_memory": {"3": 17071734784},
-                    "gpu_used_memory": {"3": 17040539648},
-                    "gpu_utilization": {"3": 29.4},
-                    "total_memory": 34359738368,
-                    "total_time": 17368.0,
-                    "used_memory": 3250450432,
-                }
-            },
-            "total_time": 18203,
-        }
-    )
-
-    return [
+@pytest.fixture(scope="session")
+def multi_node():
+    """Multiple nodes with 20 cpus, 80 GB, 9 minutes 8205048."""
+    return _MULTI_NODE_LINES
+
+
+_SINGLE_GPU_COMMENT = to_comment(
+    {
+        "gpus": True,
+        "nodes": {
+            "tiger-i23g14": {
+                "cpus": 1,
+                "gpu_total_memory": {"3": 17071734784},
+                "gpu_used_memory": {"3": 17040539648},
+                "gpu_utilization": {"3": 29.4},
+                "total_memory": 34359738368,
+                "total_time": 17368.0,
+                "used_memory": 3250450432,
+            }
+        },
+        "total_time": 18203,
+    }
+)
+_SINGLE_GPU_LINES = freeze_entries(
+    [
         to_sacct_dict(
-            f"{comment}|1|05:03:23|8197399|8197399||1|32G|COMPLETED|23:59:00|04:49:38"
+            f"{_SINGLE_GPU_COMMENT}|1|05:03:23|8197399|8197399||1|32G|COMPLETED|23:59:00|04:49:38"
         ),
         to_sacct_dict(
             "|1|05:03:23|8197399.batch|8197399.batch|3132024K|1||COMPLETED||04:49:38"
@@ -155,41 +170,48 @@ def single_gpu():
             "|1|05:03:23|8197399.extern|8197399.extern|0|1||COMPLETED||00:00:00"
         ),
     ]
+)
 
 
-@pytest.fixture()
-def multi_gpu():
-    """4 gpus, 30% mem eff, 3% util 8189521."""
-    comment = to_comment(
-        {
-            "gpus": True,
-            "nodes": {
-                "tiger-i19g9": {
-                    "cpus": 28,
-                    "gpu_total_memory": {
-                        "0": 17071734784,
-                        "1": 17071734784,
-                        "2": 17071734784,
-                        "3": 17071734784,
-                    },
-                    "gpu_used_memory": {
-                        "0": 5146542080,
-                        "1": 5146542080,
-                        "2": 5146542080,
-                        "3": 5146542080,
-                    },
-                    "gpu_utilization": {"0": 3.5, "1": 3.5, "2": 3.2, "3": 3.8},
-                    "total_memory": 117440512000,
-                    "total_time": 201481.2,
-                    "used_memory": 30866018304,
-                }
-            },
-            "total_time": 68687,
-        }
-    )
-    return [
+@pytest.fixture(scope="session")
+def single_gpu():
+    """One gpu, used all 16 GB, 30% eff 8197399."""
+    return _SINGLE_GPU_LINES
+
+
+# node shared by the multi gpu fixtures, never mutated
+_TIGER_I19G9 = {
+    "cpus": 28,
+    "gpu_total_memory": {
+        "0": 17071734784,
+        "1": 17071734784,
+        "2": 17071734784,
+        "3": 17071734784,
+    },
+    "gpu_used_memory": {
+        "0": 5146542080,
+        "1": 5146542080,
+        "2": 5146542080,
+        "3": 5146542080,
+    },
+    "gpu_utilization": {"0": 3.5, "1": 3.5, "2": 3.2, "3": 3.8},
+    "total_memory": 117440512000,
+    "total_time": 201481.2,
+    "used_memory": 30866018304,
+}
+
+
+_MULTI_GPU_COMMENT = to_comment(
+    {
+        "gpus": True,
+        "nodes": {"tiger-i19g9": _TIGER_I19G9},
+        "total_time": 68687,
+    }
+)
+_MULTI_GPU_LINES = freeze_entries(
+    [
         to_sacct_dict(
-            f"{comment}|28|19:04:47|8189521|8189521||1|112000M|"
+            f"{_MULTI_GPU_COMMENT}|28|19:04:47|8189521|8189521||1|112000M|"
             "CANCELLED by 129276|23:00:00|2-07:51:43"
         ),
         to_sacct_dict(
@@ -199,60 +221,47 @@ def multi_gpu():
             "|28|19:04:47|8189521.extern|8189521.extern|0|1||COMPLETED||00:00:00"
         ),
     ]
+)
 
 
-@pytest.fixture()
-def multi_node_multi_gpu():
-    """Made up job with multiple nodes and gpus."""
-    comment = to_comment(
-        {
-            "gpus": True,
-            "nodes": {
-                "tiger-i19g9": {
-                    "cpus": 28,
-                    "gpu_total_memory": {
-                        "0": 17071734784,
-                        "1": 17071734784,
-                        "2": 17071734784,
-                        "3": 17071734784,
-                    },
-                    "gpu_used_memory": {
-                        "0": 5146542080,
-                        "1": 5146542080,
-                        "2": 5146542080,
-                        "3": 5146542080,
-                    },
-                    "gpu_utilization": {"0": 3.5, "1": 3.5, "2": 3.2, "3": 3.8},
-                    "total_memory": 117440512000,
-                    "total_time": 201481.2,
-                    "used_memory": 30866018304,
+@pytest.fixture(scope="session")
+def multi_gpu():
+    """4 gpus, 30% mem eff, 3% util 8189521."""
+    return _MULTI_GPU_LINES
+
+
+_MULTI_NODE_MULTI_GPU_COMMENT = to_comment(
+    {
+        "gpus": True,
+        "nodes": {
+            "tiger-i19g9": _TIGER_I19G9,
+            "tiger-i19g10": {
+                "cpus": 28,
+                "gpu_total_memory": {
+                    "0": 17071734783,
+                    "1": 17071734783,
+                    "2": 17071734783,
+                    "3": 17071734783,
                 },
-                "tiger-i19g10": {
-                    "cpus": 28,
-                    "gpu_total_memory": {
-                        "0": 17071734783,
-                        "1": 17071734783,
-                        "2": 17071734783,
-                        "3": 17071734783,
-                    },
-                    "gpu_used_memory": {
-                        "0": 5146542380,
-                        "1": 5146542380,
-                        "2": 5146542322,
-                        "3": 5146542380,
-                    },
-                    "gpu_utilization": {"0": 7.5, "1": 7.5, "2": 7.2, "3": 7.8},
-                    "total_memory": 117440512000,
-                    "total_time": 201411.2,
-                    "used_memory": 30266018304,
+                "gpu_used_memory": {
+                    "0": 5146542380,
+                    "1": 5146542380,
+                    "2": 5146542322,
+                    "3": 5146542380,
                 },
+                "gpu_utilization": {"0": 7.5, "1": 7.5, "2": 7.2, "3": 7.8},
+                "total_memory": 117440512000,
+                "total_time": 201411.2,
+                "used_memory": 30266018304,
             },
-            "total_time": 68687,
-        }
-    )
-    return [
+        },
+        "total_time": 68687,
+    }
+)
+_MULTI_NODE_MULTI_GPU_LINES = freeze_entries(
+    [
         to_sacct_dict(
-            f"{comment}|28|19:04:47|8189521|8189521||1|112000M|"
+            f"{_MULTI_NODE_MULTI_GPU_COMMENT}|28|19:04:47|8189521|8189521||1|112000M|"
             "CANCELLED by 129276|23:00:00|2-07:51:43"
         ),
         to_sacct_dict(
@@ -262,15 +271,20 @@ def multi_node_multi_gpu():
             "|28|19:04:47|8189521.extern|8189521.extern|0|1||COMPLETED||00:00:00"
         ),
     ]
+)
 
 
-@pytest.fixture()
-def short_job():
-    """Used for jobs which don't last long enough 8205464."""
-    comment = "JS1:Short"
-    return [
+@pytest.fixture(scope="session")
+def multi_node_multi_gpu():
+    """Made up job with multiple nodes and gpus."""
+    return _MULTI_NODE_MULTI_GPU_LINES
+
+
+_SHORT_JOB_COMMENT = "JS1:Short"
+_SHORT_JOB_LINES = freeze_entries(
+    [
         to_sacct_dict(
-            f"{comment}|8|00:00:02|8205464|8205464||1|64G|FAILED|1-00:00:00|00:01.608"
+            f"{_SHORT_JOB_COMMENT}|8|00:00:02|8205464|8205464||1|64G|FAILED|1-00:00:00|00:01.608"
         ),
         to_sacct_dict("|8|00:00:02|8205464.batch|8205464.batch|0|1||FAILED||00:00.020"),
         to_sacct_dict(
@@ -278,12 +292,17 @@ def short_job():
         ),
         to_sacct_dict("|8|00:00:02|8205464.0|8205464.0|0|1||FAILED||00:01.587"),
     ]
+)
 
 
-@pytest.fixture()
-def bad_gpu():
-    """Job with a failure due to bad gpu."""
-    return [
+@pytest.fixture(scope="session")
+def short_job():
+    """Used for jobs which don't last long enough 8205464."""
+    return _SHORT_JOB_LINES
+
+
+_BAD_GPU_LINES = freeze_entries(
+    [
         to_sacct_dict(
             "JS1:H4sIAMMP3WMC/12NQQrDIBRE7/LXthj1q9/LhFAlFLSGRhdFvHuTphTS5TDz3"
             "jR4ZB9WcA18iHG6RC5n3GPJZYpjCik/X+CUIEXaCNIM6hr8rxi0sUSEKNgXKfcUwA"
@@ -298,12 +317,17 @@ def bad_gpu():
             "|1|07:42:19|45352405.extern|45352405.extern|104K|1||COMPLETED||00:00:00"
         ),
     ]
+)
 
 
 @pytest.fixture()
-def bad_gpu_used():
-    """Job with a failure due to gpu with no utilization."""
-    return [
+def bad_gpu():
+    """Job with a failure due to bad gpu."""
+    return _BAD_GPU_LINES
+
+
+_BAD_GPU_USED_LINES = freeze_entries(
+    [
         to_sacct_dict(
             "JS1:H4sIAN7HCGQC/1WOQQ6DIBBF7zJrawYGRvAyxlRiSFBMi4vWcPeitk1c/sy8//4GcxzcE9oNBhdCfwuoR7nHFFMfuslN8fGCViORYGUQsYL16Yb/RZGyDbNhNNUXSn5y0FpGZFNzBfdlLQYhKxiXtbsWb1BsRhtrSWkrSztdcj6hi/JkGk2sSMuDEEYSSqFY849IPvh3n3ycd6L82FrnnK8jDQmpDqAslPkDhnD5Hg8BAAA=|12|23:05:24|46044267|46044267||1|48000M|TIMEOUT|23:00:00|11-02:46:01"
         ),
@@ -314,12 +338,17 @@ def bad_gpu_used():
             "|12|23:05:24|46044267.extern|46044267.extern|0|1||COMPLETED||00:00:00"
         ),
     ]
+)
 
 
 @pytest.fixture()
-def multinode_job():
-    """Job run on multiple nodes."""
-    return [
+def bad_gpu_used():
+    """Job with a failure due to gpu with no utilization."""
+    return _BAD_GPU_USED_LINES
+
+
+_MULTINODE_JOB_LINES = freeze_entries(
+    [
         to_sacct_dict(
             "|720|12-14:16:39|6196869|6196869||20|191846Mn|COMPLETED|UNLIMITED|451-06:00:24"
         ),
@@ -327,12 +356,17 @@ def multinode_job():
             "|36|12-14:16:39|6196869.batch|6196869.batch|33824748K|1|191846Mn|COMPLETED||451-06:00:24"
         ),
     ]
+)
 
 
 @pytest.fixture()
-def issue_41():
-    """Job run on multiple nodes, with multiple tasks."""
-    return [
+def multinode_job():
+    """Job run on multiple nodes."""
+    return _MULTINODE_JOB_LINES
+
+
+_ISSUE_41_LINES = freeze_entries(
+    [
         to_sacct_dict(
             "|8|00:00:53|131042|131042||1|16000M|COMPLETED|00:01:00|06:57.815|8"
         ),
@@ -346,6 +380,13 @@ def issue_41():
             "|8|00:00:53|131042.0|131042.0|1947276K|1||COMPLETED||06:57.779|8"
         ),
     ]
+)
+
+
+@pytest.fixture()
+def issue_41():
+    """Job run on multiple nodes, with multiple tasks."""
+    return _ISSUE_41_LINES
 
 
 @pytest.fixture()
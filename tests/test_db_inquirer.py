@@ -181,9 +181,8 @@ def test_sacct_get_db_output(sacct, mocker):
         "reportseff.db_inquirer.subprocess.run",
         side_effect=subprocess.CalledProcessError(1, "test"),
     )
-    with pytest.raises(RuntimeError) as exception:
+    with pytest.raises(RuntimeError, match="Error running sacct!"):
         sacct.get_db_output("c1 c2".split(), "j1 j2 j3".split())
-    assert "Error running sacct!" in str(exception)
 
     mock_sacct = mocker.MagicMock()
     mock_sacct.returncode = 0
@@ -670,11 +669,11 @@ def test_partition_timelimit_failure(sacct, mocker):
     mock_sacct.stdout = ""
     mocker.patch("reportseff.db_inquirer.subprocess.run", return_value=mock_sacct)
 
-    with pytest.raises(RuntimeError) as exception:
+    with pytest.raises(
+        RuntimeError, match="Error retrieving information from scontrol"
+    ):
         sacct.get_partition_timelimits()
 
-    assert "Error retrieving information from scontrol" in str(exception.value)
-
 
 def test_partition_timelimit(sacct, mocker):
     """Can process scontrol output."""
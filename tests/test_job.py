@@ -3,6 +3,26 @@
 import pytest
 from reportseff import job as job_module
 
+#: Main job entry shared by update tests, override keys as needed
+BASE_UPDATE = {
+    "JobID": "24371655",
+    "State": "COMPLETED",
+    "AllocCPUS": "1",
+    "REQMEM": "1Gn",
+    "TotalCPU": "00:09:00",
+    "Elapsed": "00:10:00",
+    "Timelimit": "00:20:00",
+    "MaxRSS": "",
+    "NNodes": "1",
+    "NTasks": "",
+}
+
+#: Object of a foreign type for equality checks
+NOT_A_JOB = object()
+
+#: Memory multiples in increasing powers of 1024
+MEM_UNITS = ("K", "M", "G", "T", "E")
+
 
 @pytest.fixture()
 def job():
@@ -10,6 +30,19 @@ def job():
     return job_module.Job("job", "jobid", "filename")
 
 
+@pytest.fixture()
+def build_job():
+    """Factory to create a job and update it with each provided entry."""
+
+    def _build_job(jobid, lines, job=None):
+        result = job_module.Job(job or jobid, jobid, None)
+        for line in lines:
+            result.update(line)
+        return result
+
+    return _build_job
+
+
 def test_eq():
     """Jobs must have all matching values to equal."""
     job1 = job_module.Job("j1", "j1", "filename")
@@ -18,10 +51,20 @@ def test_eq():
 
     job2 = job_module.Job("j2", "j1", "filename")
     assert job1 != job2
-    job2 = {}
+    assert job1 != NOT_A_JOB
+
+    job2 = job_module.Job("j1", "j1", "filename")
+    job2.state = "COMPLETED"
     assert job1 != job2
 
 
+def test_slots(job):
+    """Jobs store attributes in slots only."""
+    assert not hasattr(job, "__dict__")
+    with pytest.raises(AttributeError):
+        job.not_an_attribute = 1
+
+
 def test_repr():
     """Representation builds constructor."""
     job1 = job_module.Job("j1", "jid1", "filename")
@@ -46,20 +89,7 @@ def test_job_init(job):
 def test_update_main_job():
     """Updating jobs changes expected properties."""
     job = job_module.Job("24371655", "24371655", None)
-    job.update(
-        {
-            "JobID": "24371655",
-            "State": "COMPLETED",
-            "AllocCPUS": "1",
-            "REQMEM": "1Gn",
-            "TotalCPU": "00:09:00",
-            "Elapsed": "00:10:00",
-            "Timelimit": "00:20:00",
-            "MaxRSS": "",
-            "NNodes": "1",
-            "NTasks": "",
-        }
-    )
+    job.update(BASE_UPDATE)
     assert job.state == "COMPLETED"
     assert job.time == "00:10:00"
     assert job.time_eff == 50.0
@@ -67,20 +97,7 @@ def test_update_main_job():
     assert job.totalmem == 1 * 1024**2
 
     job = job_module.Job("24371655", "24371655", None)
-    job.update(
-        {
-            "JobID": "24371655",
-            "State": "COMPLETED",
-            "AllocCPUS": "1",
-            "REQMEM": "1G",
-            "TotalCPU": "00:09:00",
-            "Elapsed": "00:10:00",
-            "Timelimit": "00:20:00",
-            "MaxRSS": "",
-            "NNodes": "1",
-            "NTasks": "",
-        }
-    )
+    job.update({**BASE_UPDATE, "REQMEM": "1G"})
     assert job.state == "COMPLETED"
     assert job.time == "00:10:00"
     assert job.time_eff == 50.0
@@ -88,18 +105,9 @@ def test_update_main_job():
     assert job.totalmem == 1 * 1024**2
 
     job = job_module.Job("24371655", "24371655", None)
-    job.update(
-        {
-            "JobID": "24371655",
-            "State": "COMPLETED",
-            "AllocCPUS": "1",
-            "REQMEM": "1G",
-            "TotalCPU": "00:09:00",
-            "Elapsed": "00:10:00",
-            "Timelimit": "00:20:00",
-            "MaxRSS": "",
-        }
-    )
+    entry = {**BASE_UPDATE, "REQMEM": "1G"}
+    del entry["NNodes"], entry["NTasks"]
+    job.update(entry)
     assert job.state == "COMPLETED"
     assert job.time == "00:10:00"
     assert job.time_eff == 50.0
@@ -107,20 +115,7 @@ def test_update_main_job():
     assert job.totalmem is None
 
     job = job_module.Job("24371655", "24371655", None)
-    job.update(
-        {
-            "JobID": "24371655",
-            "State": "PENDING",
-            "AllocCPUS": "1",
-            "REQMEM": "1Gn",
-            "TotalCPU": "00:09:00",
-            "Elapsed": "00:10:00",
-            "Timelimit": "00:20:00",
-            "MaxRSS": "",
-            "NNodes": "1",
-            "NTasks": "",
-        }
-    )
+    job.update({**BASE_UPDATE, "State": "PENDING"})
     assert job.state == "PENDING"
     assert job.time == "---"
     assert job.time_eff == "---"
@@ -128,34 +123,8 @@ def test_update_main_job():
     assert job.totalmem is None
 
     job = job_module.Job("24371655", "24371655", None)
-    job.update(
-        {
-            "JobID": "24371655",
-            "State": "RUNNING",
-            "AllocCPUS": "1",
-            "REQMEM": "1Gn",
-            "TotalCPU": "00:09:00",
-            "Elapsed": "00:10:00",
-            "Timelimit": "00:20:00",
-            "MaxRSS": "",
-            "NNodes": "1",
-            "NTasks": "",
-        }
-    )
-    job.update(
-        {
-            "JobID": "24371655.batch",
-            "State": "RUNNING",
-            "AllocCPUS": "1",
-            "REQMEM": "1Gn",
-            "TotalCPU": "00:09:00",
-            "Elapsed": "00:10:00",
-            "Timelimit": "00:20:00",
-            "MaxRSS": "",
-            "NNodes": "1",
-            "NTasks": "",
-        }
-    )
+    job.update({**BASE_UPDATE, "State": "RUNNING"})
+    job.update({**BASE_UPDATE, "JobID": "24371655.batch", "State": "RUNNING"})
     assert job.state == "RUNNING"
     assert job.time == "00:10:00"
     assert job.time_eff == 50.0
@@ -163,20 +132,7 @@ def test_update_main_job():
     assert job.totalmem is None
 
     job = job_module.Job("24371655", "24371655", None)
-    job.update(
-        {
-            "JobID": "24371655",
-            "State": "CANCELLED",
-            "AllocCPUS": "1",
-            "REQMEM": "1Gn",
-            "TotalCPU": "00:09:00",
-            "Elapsed": "00:00:00",
-            "Timelimit": "00:20:00",
-            "MaxRSS": "",
-            "NNodes": "1",
-            "NTasks": "",
-        }
-    )
+    job.update({**BASE_UPDATE, "State": "CANCELLED", "Elapsed": "00:00:00"})
     assert job.state == "CANCELLED"
     assert job.time == "00:00:00"
     assert job.time_eff == 0.0
@@ -286,45 +242,69 @@ def test_name(job):
     assert job.name() == "jobid"
 
 
-def test_get_entry(job):
-    """State is read properly and updated by main job entry."""
+@pytest.fixture()
+def job_test_state(job):
+    """Default job with a placeholder state."""
     job.state = "TEST"
-    assert job.get_entry("MemEff") == "---"
-    assert job.get_entry("TimeEff") == "---"
-    assert job.get_entry("CPUEff") == "---"
-    assert job.get_entry("undefined") == "---"
+    return job
 
-    job = job_module.Job("24371655", "24371655", None)
-    job.update(
-        {
-            "JobID": "24371655",
-            "State": "CANCELLED",
-            "AllocCPUS": "1",
-            "REQMEM": "1Gn",
-            "TotalCPU": "00:09:00",
-            "Elapsed": "00:00:00",
-            "Timelimit": "00:20:00",
-            "MaxRSS": "",
-            "NNodes": "1",
-            "NTasks": "",
-        }
+
+@pytest.fixture()
+def job_cancelled(build_job):
+    """Job updated by a cancelled main job entry."""
+    return build_job(
+        "24371655",
+        [{**BASE_UPDATE, "State": "CANCELLED", "Elapsed": "00:00:00"}],
     )
-    assert job.get_entry("JobID") == "24371655"
-    assert job.get_entry("State") == "CANCELLED"
-    assert job.get_entry("MemEff") == 0.0
-    assert job.get_entry("TimeEff") == 0.0
-    assert job.get_entry("CPUEff") == "---"
-    assert job.get_entry("undefined") == "---"
-    assert job.get_entry("Elapsed") == "00:00:00"
 
 
-def test_parse_slurm_timedelta():
+@pytest.mark.parametrize(
+    ("entry", "expected"),
+    [
+        ("MemEff", "---"),
+        ("TimeEff", "---"),
+        ("CPUEff", "---"),
+        ("undefined", "---"),
+    ],
+)
+def test_get_entry(job_test_state, entry, expected):
+    """Entries default to placeholders before an update."""
+    assert job_test_state.get_entry(entry) == expected
+
+
+@pytest.mark.parametrize(
+    ("entry", "expected"),
+    [
+        ("JobID", "24371655"),
+        ("State", "CANCELLED"),
+        ("MemEff", 0.0),
+        ("TimeEff", 0.0),
+        ("CPUEff", "---"),
+        ("undefined", "---"),
+        ("Elapsed", "00:00:00"),
+    ],
+)
+def test_get_entry_updated(job_cancelled, entry, expected):
+    """State is read properly and updated by main job entry."""
+    assert job_cancelled.get_entry(entry) == expected
+
+
+@pytest.mark.parametrize(
+    ("timestamp", "seconds"),
+    [
+        ("01-03:04:02", 97442),
+        ("03:04:02", 11042),
+        ("04:02.123", 242),
+    ],
+    ids=["days", "hms", "msec"],
+)
+def test_parse_slurm_timedelta(timestamp, seconds):
     """Can parse all types of time formats."""
-    timestamps = ["01-03:04:02", "03:04:02", "04:02.123"]
-    expected_seconds = [97442, 11042, 242]
-    for timestamp, seconds in zip(timestamps, expected_seconds):
-        assert job_module._parse_slurm_timedelta(timestamp) == seconds
+    assert job_module._parse_slurm_timedelta(timestamp) == seconds
 
+
+def test_parse_slurm_timedelta_invalid():
+    """Unknown time formats raise informative errors."""
     with pytest.raises(ValueError, match="Failed to parse time 'asdf'"):
         job_module._parse_slurm_timedelta("asdf")
 
@@ -332,7 +312,7 @@ def test_parse_slurm_timedelta():
 def test_parsemem_nodes():
     """Can parse memory entries with nodes provided."""
     for mem in (1, 2, 4):
-        for exp, multiple in enumerate("K M G T E".split()):
+        for exp, multiple in enumerate(MEM_UNITS):
             for alloc in (1, 2, 4):
                 assert (
                     job_module.parsemem(f"{mem}{multiple}n", alloc, -1)
@@ -343,7 +323,7 @@ def test_parsemem_nodes():
 def test_parsemem_cpus():
     """Can parse memory entries with cpus provided."""
     for mem in (1, 2, 4):
-        for exp, multiple in enumerate("K M G T E".split()):
+        for exp, multiple in enumerate(MEM_UNITS):
             for alloc in (1, 2, 4):
                 assert (
                     job_module.parsemem(f"{mem}{multiple}c", -1, alloc)
@@ -353,19 +333,23 @@ def test_parsemem_cpus():
 
 def test_parsememstep():
     """Can parse memory for steps and handle odd formats."""
-    for exp, multiple in enumerate("K M G T E".split()):
+    for exp, multiple in enumerate(MEM_UNITS):
         for mem in (2, 4, 6):
             assert job_module.parsemem(f"{mem}{multiple}") == mem * 1024**exp
 
-    with pytest.raises(ValueError, match="Failed to parse memory '18GG'"):
-        job_module.parsemem("18GG")
-
     assert job_module.parsemem("") == 0
     assert job_module.parsemem("0") == 0
     assert job_module.parsemem("5") == 5
     assert job_module.parsemem("1084.50M") == 1084.5 * 1024
 
 
+@pytest.mark.parametrize("mem", ["18GG", "1XYZ", "GG"])
+def test_parsemem_invalid(mem):
+    """Malformed memory entries raise informative errors."""
+    with pytest.raises(ValueError, match=f"Failed to parse memory '{mem}'"):
+        job_module.parsemem(mem)
+
+
 def test_unknown_admin_comment(job):
     """Unknown comment types raise informative errors."""
     with pytest.raises(ValueError, match="Unknown comment type 'JS0'"):
@@ -383,31 +367,36 @@ def test_unknown_admin_comment(job):
     job._parse_admin_comment('\'{"arrayTaskId":4294967294...')
 
 
-def test_single_core(single_core):
+@pytest.mark.parametrize(
+    ("fixture", "jobid", "expected"),
+    [
+        ("single_core", "39889258_1426", (99.7, 3.6, None, None)),
+        ("multi_node", "8205048", (4.6, 1.1, None, None)),
+        ("single_gpu", "8197399", (95.4, 9.5, 29.4, 99.8)),
+        ("multi_gpu", "8189521", (10.5, 26.3, 3.5, 30.1)),
+        ("multi_node_multi_gpu", "8189521", (10.5, 26.0, 5.5, 30.1)),
+        ("short_job", "8205464", (6.2, None, None, None)),
+        ("bad_gpu", "45352405", (99.5, 39.1, 0, 1.0)),
+        ("bad_gpu_used", "46044267", (96.2, 86.4, 4.8, 11.1)),
+    ],
+)
+def test_update(request, build_job, fixture, jobid, expected):
+    """Efficiencies (cpu, mem, gpu, gpu mem) are set from sacct entries."""
+    job = build_job(jobid, request.getfixturevalue(fixture))
+    assert (job.cpu, job.mem_eff, job.gpu, job.gpu_mem) == expected
+
+
+def test_single_core(single_core, build_job):
     """Job with single node is updated properly."""
-    job = job_module.Job("39895850", "39889258_1426", None)
-    for line in single_core:
-        job.update(line)
-
-    assert job.cpu == 99.7
-    assert job.mem_eff == 3.6
-    assert job.gpu is None
-    assert job.gpu_mem is None
+    job = build_job("39889258_1426", single_core, job="39895850")
     # single nodes are not printed
     assert list(job.get_node_entries("JobID")) == ["39889258_1426"]
     assert list(job.get_node_entries("CPUEff")) == [99.7]
 
 
-def test_multi_node(multi_node):
+def test_multi_node(multi_node, build_job):
     """Job with multiple nodes is updated properly."""
-    job = job_module.Job("8205048", "8205048", None)
-    for line in multi_node:
-        job.update(line)
-
-    assert job.cpu == 4.6
-    assert job.mem_eff == 1.1
-    assert job.gpu is None
-    assert job.gpu_mem is None
+    job = build_job("8205048", multi_node)
 
     assert list(job.get_node_entries("JobID")) == [
         "8205048",
@@ -442,16 +431,9 @@ def test_multi_node(multi_node):
     ]
 
 
-def test_single_gpu(single_gpu):
+def test_single_gpu(single_gpu, build_job):
     """Jobs with GPUs are reported properly."""
-    job = job_module.Job("8197399", "8197399", None)
-    for line in single_gpu:
-        job.update(line)
-
-    assert job.cpu == 95.4
-    assert job.mem_eff == 9.5
-    assert job.gpu == 29.4
-    assert job.gpu_mem == 99.8
+    job = build_job("8197399", single_gpu)
 
     # without forcing GPU output
     assert list(job.get_node_entries("JobID")) == ["8197399"]
@@ -492,16 +474,9 @@ def test_single_gpu(single_gpu):
     ]
 
 
-def test_multi_gpu(multi_gpu):
+def test_multi_gpu(multi_gpu, build_job):
     """Single core, multi gpu jobs are updated properly."""
-    job = job_module.Job("8189521", "8189521", None)
-    for line in multi_gpu:
-        job.update(line)
-
-    assert job.cpu == 10.5
-    assert job.mem_eff == 26.3
-    assert job.gpu == 3.5
-    assert job.gpu_mem == 30.1
+    job = build_job("8189521", multi_gpu)
 
     # without forcing GPU output
     assert list(job.get_node_entries("JobID")) == ["8189521"]
@@ -557,16 +532,9 @@ def test_multi_gpu(multi_gpu):
     ]
 
 
-def test_multi_node_multi_gpu(multi_node_multi_gpu):
+def test_multi_node_multi_gpu(multi_node_multi_gpu, build_job):
     """Multiple nodes with multiple gpus are updated properly."""
-    job = job_module.Job("8189521", "8189521", None)
-    for line in multi_node_multi_gpu:
-        job.update(line)
-
-    assert job.cpu == 10.5
-    assert job.mem_eff == 26.0
-    assert job.gpu == 5.5
-    assert job.gpu_mem == 30.1
+    job = build_job("8189521", multi_node_multi_gpu)
 
     assert list(job.get_node_entries("JobID")) == [
         "8189521",
@@ -669,16 +637,9 @@ def test_multi_node_multi_gpu(multi_node_multi_gpu):
     ]
 
 
-def test_short_job(short_job):
+def test_short_job(short_job, build_job):
     """Jobs with JS1:Short are handled with sacct info instead."""
-    job = job_module.Job("8205464", "8205464", None)
-    for line in short_job:
-        job.update(line)
-
-    assert job.cpu == 6.2
-    assert job.mem_eff is None
-    assert job.gpu is None
-    assert job.gpu_mem is None
+    job = build_job("8205464", short_job)
 
     assert list(job.get_node_entries("JobID")) == ["8205464"]
     assert list(job.get_node_entries("JobID", gpu=True)) == ["8205464"]
@@ -686,32 +647,18 @@ def test_short_job(short_job):
     assert list(job.get_node_entries("State")) == ["FAILED"]
 
 
-def test_bad_gpu(bad_gpu):
+def test_bad_gpu(bad_gpu, build_job):
     """Jobs failing due to gpu are parsed properly."""
-    job = job_module.Job("45352405", "45352405", None)
-    for line in bad_gpu:
-        job.update(line)
-
-    assert job.cpu == 99.5
-    assert job.mem_eff == 39.1
-    assert job.gpu == 0
-    assert job.gpu_mem == 1.0
+    job = build_job("45352405", bad_gpu)
 
     assert list(job.get_node_entries("JobID")) == ["45352405"]
     assert list(job.get_node_entries("CPUEff")) == [99.5]
     assert list(job.get_node_entries("State")) == ["CANCELLED"]
 
 
-def test_bad_gpu_utilization(bad_gpu_used):
+def test_bad_gpu_utilization(bad_gpu_used, build_job):
     """Jobs with no gpu utilization are parsed properly."""
-    job = job_module.Job("46044267", "46044267", None)
-    for line in bad_gpu_used:
-        job.update(line)
-
-    assert job.cpu == 96.2
-    assert job.mem_eff == 86.4
-    assert job.gpu == 4.8
-    assert job.gpu_mem == 11.1
+    job = build_job("46044267", bad_gpu_used)
 
     assert list(job.get_node_entries("JobID")) == ["46044267"]
     assert list(job.get_node_entries("CPUEff")) == [96.2]
@@ -755,23 +702,19 @@ def test_issue_26(get_jobstats):
     assert job.mem_eff == 0
 
 
-def test_multinode_job(multinode_job):
+def test_multinode_job(multinode_job, build_job):
     """Testing issue37 which is not actually a bug efficiency is truly 5%."""
-    job = job_module.Job("6196869", "6196869", None)
-    for line in multinode_job:
-        job.update(line)
+    job = build_job("6196869", multinode_job)
 
     assert job.cpu == 5.0
 
 
-def test_multinode_job_issue_41(issue_41):
+def test_multinode_job_issue_41(issue_41, build_job):
     """Testing issue 41 where multiple tasks are used.
 
     Previously reported incorrect memory efficiency.
     """
-    job = job_module.Job("131042", "131042", None)
-    for line in issue_41:
-        job.update(line)
+    job = build_job("131042", issue_41)
 
     assert job.cpu == 98.3
     assert job.get_entry("MemEff") == 95.1
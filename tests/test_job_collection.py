@@ -1,6 +1,10 @@
 """Test job collection functions."""
 
+import os
+import sys
+from contextlib import nullcontext
 from pathlib import Path
+from types import SimpleNamespace
 
 import pytest
 from reportseff import job_collection
@@ -13,12 +17,79 @@ def jobs():
     return job_collection.JobCollection()
 
 
+def entry_from_line(line):
+    """Account entry keyed by the default columns from a pipe separated line."""
+    return dict(zip(job_collection.COLUMNS, line.split("|")))
+
+
+class FakeDirEntry:
+    """Minimal stand in for os.DirEntry."""
+
+    def __init__(self, name, mtime=None, *, removed=False):
+        """Create entry with the provided name, directories have no mtime."""
+        self.name = name
+        self.mtime = mtime
+        self.removed = removed
+
+    def is_file(self, *, follow_symlinks=True):  # noqa: ARG002
+        """Report the file type from the directory listing."""
+        return self.mtime is not None
+
+    def stat(self, *, follow_symlinks=True):  # noqa: ARG002
+        """Report the modified time, fail if removed after listing."""
+        if self.removed:
+            raise FileNotFoundError(self.name)
+        return fake_stat(self.mtime)
+
+
+def fake_stat(mtime):
+    """Stat result with only the modified time set."""
+    return os.stat_result((0,) * 8 + (mtime, 0))
+
+
+@pytest.fixture()
+def fake_fs(monkeypatch):
+    """In-memory file system for listing and checking output files.
+
+    Add directory paths to `dirs` and map file paths to modified times in
+    `files`. Paths in `removed` are listed but fail to stat, as if deleted
+    after the listing. Each file stat is recorded in `stat_calls`.
+    """
+    fs = SimpleNamespace(dirs=set(), files={}, removed=set(), stat_calls=[])
+
+    def scandir(directory):
+        return nullcontext(
+            [
+                FakeDirEntry(
+                    Path(path).name, fs.files.get(path), removed=path in fs.removed
+                )
+                for path in [*fs.files, *sorted(fs.dirs)]
+                if str(Path(path).parent) == str(directory)
+            ]
+        )
+
+    def exists(path):
+        return str(path) in fs.dirs or str(path) in fs.files
+
+    def stat(path, **_kwargs):
+        fs.stat_calls.append(str(path))
+        if str(path) not in fs.files or str(path) in fs.removed:
+            raise FileNotFoundError(path)
+        return fake_stat(fs.files[str(path)])
+
+    monkeypatch.setattr(job_collection.os, "scandir", scandir)
+    monkeypatch.setattr(job_collection.Path, "exists", exists)
+    monkeypatch.setattr(job_collection.Path, "stat", stat)
+    return fs
+
+
 def test_get_columns(jobs):
     """Default get columns are reasonable."""
-    assert jobs.get_columns() == (
+    assert list(jobs.get_columns()) == (
         "JobIDRaw,JobID,State,AllocCPUS,TotalCPU,Elapsed,Timelimit,"
         "REQMEM,MaxRSS,NNodes,NTasks,Partition"
     ).split(",")
+    assert jobs.get_columns() is job_collection.COLUMNS
 
 
 def test_get_jobs(jobs):
@@ -26,41 +97,40 @@ def test_get_jobs(jobs):
     assert jobs.get_jobs() == []
 
     jobs.jobs = {
+        "2_2": Job("2", "2_2", None),
         "1_1": Job("1", "1_1", None),
         "1_2": Job("1", "1_2", None),
-        "2_2": Job("2", "2_2", None),
+        "3": Job("3", "3", None),
     }
-    assert jobs.get_jobs() == "1,2".split(",")
+    assert jobs.get_jobs() == "2,1,3".split(",")
 
 
-def test_set_out_dir_dir_handling(jobs, mocker):
+def test_set_out_dir_dir_handling(jobs, mocker, fake_fs):
     """Can handle setting path from cwd or provided value."""
     # dir handling
     mock_cwd = mocker.patch(
         "reportseff.job_collection.Path.cwd", return_value=Path("/dir/path")
     )
-    mock_real = mocker.patch(
-        "reportseff.job_collection.Path.resolve", return_value=Path("/dir/path2")
-    )
-    mock_exists = mocker.patch(
-        "reportseff.job_collection.Path.exists", return_value=False
+    mock_absolute = mocker.patch(
+        "reportseff.job_collection.Path.absolute", return_value=Path("/dir/path2")
     )
 
     with pytest.raises(ValueError, match="/dir/path does not exist!"):
         jobs.set_out_dir("")
     mock_cwd.assert_called_once()
-    mock_real.assert_not_called()
-    mock_exists.assert_called_once()
+    mock_absolute.assert_not_called()
 
     mock_cwd.reset_mock()
-    mock_real.reset_mock()
-    mock_exists.reset_mock()
+    mock_absolute.reset_mock()
 
     with pytest.raises(ValueError, match="/dir/path2 does not exist!"):
         jobs.set_out_dir("pwd")
     mock_cwd.assert_not_called()
-    mock_real.assert_called_once()
-    mock_exists.assert_called_once()
+    mock_absolute.assert_called_once()
+
+    fake_fs.dirs.add("/dir/path2")
+    with pytest.raises(ValueError, match="/dir/path2 contains no files!"):
+        jobs.set_out_dir("pwd")
 
 
 def test_set_jobs_none_valid(jobs):
@@ -71,12 +141,14 @@ def test_set_jobs_none_valid(jobs):
 
 def test_set_jobs_filter(jobs):
     """Set jobs take only valid names from list."""
-    jobs.set_jobs(("asdf", "1", "1_1", "asdf_1_2", "1_asdf_2"))
+    # non-ascii digits are not job ids
+    jobs.set_jobs(("asdf", "1", "1_1", "asdf_1_2", "1_asdf_2", "\u0663", "23"))
     assert jobs.jobs == {
         "1": Job("1", "1", None),
         "1_1": Job("1", "1_1", None),
         "1_2": Job("1", "1_2", "asdf_1_2"),
         "2": Job("2", "2", "1_asdf_2"),
+        "23": Job("23", "23", None),
     }
 
 
@@ -106,30 +178,20 @@ def test_process_line(jobs, mocker):
     jobs.jobs = {"24371655": Job("24371655", "24371655", "test_24371655")}
     mock_update = mocker.patch.object(Job, "update")
     jobs.process_entry(
-        dict(
-            zip(
-                jobs.get_columns(),
-                "24371655|24371655|COMPLETED|1|"
-                "01:29:47|01:29:56|03:00:00|1Gn||1|".split("|"),
-            )
+        entry_from_line(
+            "24371655|24371655|COMPLETED|1|01:29:47|01:29:56|03:00:00|1Gn||1|"
         )
     )
     jobs.process_entry(
-        dict(
-            zip(
-                jobs.get_columns(),
-                "24371655.batch|24371655.batch|COMPLETED|1|"
-                "01:29:47|01:29:56||1Gn|495644K|1|1".split("|"),
-            )
+        entry_from_line(
+            "24371655.batch|24371655.batch|COMPLETED|1|"
+            "01:29:47|01:29:56||1Gn|495644K|1|1"
         )
     )
     jobs.process_entry(
-        dict(
-            zip(
-                jobs.get_columns(),
-                "24371655.extern|24371655.extern|COMPLETED|1|"
-                "00:00:00|01:29:56||1Gn|1372K|1|1".split("|"),
-            )
+        entry_from_line(
+            "24371655.extern|24371655.extern|COMPLETED|1|"
+            "00:00:00|01:29:56||1Gn|1372K|1|1"
         )
     )
 
@@ -187,12 +249,9 @@ def test_process_line_partition_timelimit_not_set(jobs, mocker):
     jobs.jobs = {"24371655": Job("24371655", "24371655", "test_24371655")}
     mock_update = mocker.patch.object(Job, "update")
     jobs.process_entry(
-        dict(
-            zip(
-                jobs.get_columns(),
-                "24371655|24371655|COMPLETED|1|"
-                "01:29:47|01:29:56|Partition_Limit|1Gn||1||mainqueue".split("|"),
-            )
+        entry_from_line(
+            "24371655|24371655|COMPLETED|1|"
+            "01:29:47|01:29:56|Partition_Limit|1Gn||1||mainqueue"
         )
     )
 
@@ -222,12 +281,9 @@ def test_process_line_partition_timelimit(jobs, mocker):
     mock_update = mocker.patch.object(Job, "update")
     jobs.set_partition_limits({"mainqueue": "01:02:03"})
     jobs.process_entry(
-        dict(
-            zip(
-                jobs.get_columns(),
-                "24371655|24371655|COMPLETED|1|"
-                "01:29:47|01:29:56|Partition_Limit|1Gn||1||mainqueue".split("|"),
-            )
+        entry_from_line(
+            "24371655|24371655|COMPLETED|1|"
+            "01:29:47|01:29:56|Partition_Limit|1Gn||1||mainqueue"
         )
     )
 
@@ -257,12 +313,9 @@ def test_process_line_partition_timelimit_no_match(jobs, mocker):
     mock_update = mocker.patch.object(Job, "update")
     jobs.set_partition_limits({"mainqueue2": "01:02:03"})
     jobs.process_entry(
-        dict(
-            zip(
-                jobs.get_columns(),
-                "24371655|24371655|COMPLETED|1|"
-                "01:29:47|01:29:56|Partition_Limit|1Gn||1||mainqueue".split("|"),
-            )
+        entry_from_line(
+            "24371655|24371655|COMPLETED|1|"
+            "01:29:47|01:29:56|Partition_Limit|1Gn||1||mainqueue"
         )
     )
 
@@ -286,39 +339,37 @@ def test_process_line_partition_timelimit_no_match(jobs, mocker):
     ]
 
 
-def test_set_out_dir(jobs, mocker):
+def test_set_out_dir(jobs, fake_fs):
     """Can set directory with slurm out files."""
-    mocker.patch(
-        "reportseff.job_collection.Path.resolve",
-        return_value=Path("/dir/path2/test"),
-    )
-    mocker.patch("reportseff.job_collection.Path.exists", return_value=True)
-    mocker.patch("reportseff.job_collection.Path.is_file", return_value=True)
+    directory = "/dir/path2/test"
+    fake_fs.dirs.add(directory)
+    with pytest.raises(
+        ValueError,
+        match="/dir/path2/test contains no files!",
+    ):
+        jobs.set_out_dir(directory)
 
-    mocker.patch("reportseff.job_collection.Path.iterdir", return_value=[])
+    fake_fs.dirs.add(f"{directory}/a_1")
     with pytest.raises(
         ValueError,
         match="/dir/path2/test contains no files!",
     ):
-        jobs.set_out_dir("test")
+        jobs.set_out_dir(directory)
 
-    mocker.patch("reportseff.job_collection.Path.iterdir", return_value=[Path("asdf")])
+    fake_fs.files[f"{directory}/asdf"] = 4
     with pytest.raises(
         ValueError, match="/dir/path2/test contains no valid output files!"
     ):
-        jobs.set_out_dir("test")
-
-    mocker.patch(
-        "reportseff.job_collection.Path.iterdir",
-        return_value=[
-            Path("asdf"),
-            Path("base_1"),
-            Path("base_1_1.out"),
-            Path("base_2_1"),  # overwritten
-            Path("base_2_1.out"),
-        ],
-    )
-    jobs.set_out_dir("test")
+        jobs.set_out_dir(directory)
+
+    for name in (
+        "base_1",
+        "base_1_1.out",
+        "base_2_1",  # overwritten
+        "base_2_1.out",
+    ):
+        fake_fs.files[f"{directory}/{name}"] = len(name)
+    jobs.set_out_dir(directory)
 
     assert jobs.jobs == {
         "1": Job("1", "1", "base_1"),
@@ -326,49 +377,83 @@ def test_set_out_dir(jobs, mocker):
         "2_1": Job("2", "2_1", "base_2_1.out"),
     }
 
+    # modified times are recorded from the listing, no further stat calls
+    fake_fs.stat_calls.clear()
+    assert jobs.get_sorted_jobs(change_sort=True) == [
+        Job("1", "1_1", "base_1_1.out"),
+        Job("2", "2_1", "base_2_1.out"),
+        Job("1", "1", "base_1"),
+    ]
+    assert fake_fs.stat_calls == []
+
+
+def test_set_out_dir_removed_file(jobs, fake_fs):
+    """Files removed after listing are kept without a modified time."""
+    directory = "/dir/path2/test"
+    fake_fs.dirs.add(directory)
+    fake_fs.files[f"{directory}/base_1"] = 20
+    fake_fs.files[f"{directory}/base_2"] = 2
+    fake_fs.files[f"{directory}/base_3"] = 1
+    fake_fs.removed.add(f"{directory}/base_3")
+    jobs.set_out_dir(directory)
+
+    assert jobs.jobs == {
+        "1": Job("1", "1", "base_1"),
+        "2": Job("2", "2", "base_2"),
+        "3": Job("3", "3", "base_3"),
+    }
+    # missing modified time falls back to the job id
+    fake_fs.stat_calls.clear()
+    assert [job.jobid for job in jobs.get_sorted_jobs(change_sort=True)] == [
+        "1",
+        "3",
+        "2",
+    ]
+    assert fake_fs.stat_calls == []
+
 
-def test_set_custom_seff_format(jobs, mocker):
+def test_set_custom_seff_format(jobs, fake_fs):
     """Can change the slurm output file matching."""
-    mocker.patch("reportseff.job_collection.Path.exists", return_value=True)
-    mocker.patch("reportseff.job_collection.Path.is_file", return_value=True)
-    mocker.patch(
-        "reportseff.job_collection.Path.iterdir",
-        return_value=[
-            Path("asdf"),
-            Path("base_1"),
-            Path("base_1_1.out"),
-            Path("base_2_1"),
-            Path("base_2_1.out"),
-            Path("3.out"),
-            Path("4_1.out"),
-        ],
-    )
+    directory = "/dir/path2/test"
+    fake_fs.dirs.add(directory)
+    for name in (
+        "asdf",
+        "base_1",
+        "base_1_1.out",
+        "base_2_1",
+        "base_2_1.out",
+        "3.out",
+        "4_1.out",
+    ):
+        fake_fs.files[f"{directory}/{name}"] = len(name)
 
     with pytest.raises(ValueError, match="Unable to determine jobid from %n.out."):
         jobs.set_custom_seff_format("%n.out")
 
     jobs.set_custom_seff_format("%j.out")
-    assert jobs.job_file_regex.pattern == r"^(?P<jobid>(?P<job>[0-9]+))\.out$"
+    assert jobs.job_file_regex.pattern == r"(?P<jobid>(?P<job>[0-9]+))\.out"
+    # compiled patterns are reused
+    assert jobs.job_file_regex is job_collection.seff_format_to_regex("%j.out")
 
-    jobs.set_out_dir("test")
+    jobs.set_out_dir(directory)
     assert jobs.jobs == {
         "3": Job("3", "3", "3.out"),
     }
     jobs.jobs = {}
 
     jobs.set_custom_seff_format("%x%n_%A_%a")
-    assert jobs.job_file_regex.pattern == r"^.*_(?P<jobid>(?P<job>[0-9]+)_[0-9]+)$"
+    assert jobs.job_file_regex.pattern == r".*_(?P<jobid>(?P<job>[0-9]+)_[0-9]+)"
 
-    jobs.set_out_dir("test")
+    jobs.set_out_dir(directory)
     assert jobs.jobs == {
         "2_1": Job("2", "2_1", "base_2_1"),
     }
     jobs.jobs = {}
 
     jobs.set_custom_seff_format("%x_%A.out")
-    assert jobs.job_file_regex.pattern == r"^.*_(?P<jobid>(?P<job>[0-9]+))\.out$"
+    assert jobs.job_file_regex.pattern == r".*_(?P<jobid>(?P<job>[0-9]+))\.out"
 
-    jobs.set_out_dir("test")
+    jobs.set_out_dir(directory)
     assert jobs.jobs == {
         "1": Job("1", "1", "4_1.out"),
     }
@@ -378,14 +463,17 @@ def test_set_custom_seff_format(jobs, mocker):
 def test_process_seff_file(jobs):
     """Can parse job names from slurm output file names."""
     # no matches
-    jobs.process_seff_file("")
+    assert not jobs.process_seff_file("")
+    assert jobs.jobs == {}
+
+    assert not jobs.process_seff_file("base_name")
     assert jobs.jobs == {}
 
-    jobs.process_seff_file("base_name")
+    assert not jobs.process_seff_file("base_name_1out")
     assert jobs.jobs == {}
 
     # simple job file
-    jobs.process_seff_file("base_name_1")
+    assert jobs.process_seff_file("base_name_1")
     assert jobs.jobs == {"1": Job("1", "1", "base_name_1")}
 
     # with .out
@@ -450,8 +538,14 @@ def test_add_job(jobs):
         "jid2": Job("j2", "jid2", "file"),
     }
 
+    # ids are interned
+    jobs.add_job("".join(("j", "3")), "".join(("jid", "3")))
+    job = jobs.jobs["jid3"]
+    assert job.job is sys.intern("j3")
+    assert job.jobid is sys.intern("jid3")
 
-def test_get_sorted_jobs(jobs, mocker):
+
+def test_get_sorted_jobs(jobs, fake_fs):
     """Can get jobs in sorted order by name or time."""
     jobs.add_job("j3", "jid3")
     jobs.add_job("j1", "jid1")
@@ -472,22 +566,11 @@ def test_get_sorted_jobs(jobs, mocker):
     jobs.add_job("j13", "jid13")
     jobs.add_job("j14", "jid14", "nothing")
 
-    # make all non-none files exist
-    mocker.patch(
-        "reportseff.job_collection.Path.exists",
-        lambda x: str(x) != "dir/nothing",
-    )
-
-    # replace mtime with the length of the filename
-    def my_stat(file):
-        mock = mocker.MagicMock()
-        mock.st_mtime = len(file.name)
-        return mock
-
-    mocker.patch(
-        "reportseff.job_collection.Path.stat",
-        my_stat,
-    )
+    # mtime is the length of the filename, all but dir/nothing exist
+    for name in ("file3", "file12", "file234", "nothing"):
+        fake_fs.files[name] = len(name)
+    for name in ("file3", "file12", "file234"):
+        fake_fs.files[f"dir/{name}"] = len(name)
 
     # still uses other sorting, no dir_name set
     assert jobs.get_sorted_jobs(change_sort=True) == [
@@ -507,6 +590,11 @@ def test_get_sorted_jobs(jobs, mocker):
         Job("j3", "jid3", "file3"),
     ]
 
+    # each file is only checked once
+    fake_fs.stat_calls.clear()
+    jobs.get_sorted_jobs(change_sort=True)
+    assert fake_fs.stat_calls == []
+
 
 def test_process_entry_array_user(jobs):
     """Providing a user shorts the checks for existing jobs."""
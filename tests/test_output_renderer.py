@@ -12,6 +12,112 @@ min_required = (
     "REQMEM,NNodes,MaxRSS,Timelimit"
 ).split(",")
 
+# terminal color and style codes
+ANSI_ESCAPE = re.compile(r"\x1B[@-_][0-?]*[ -/]*[@-~]")
+
+# sacct entry shared by some_jobs, with the id, state and overrides of each job
+SOME_JOBS_BASE = {
+    "AllocCPUS": "1",
+    "REQMEM": "1Gn",
+    "TotalCPU": "00:09:00",
+    "Elapsed": "00:10:00",
+    "Timelimit": "00:20:00",
+    "MaxRSS": "",
+    "NNodes": "1",
+    "NTasks": "",
+}
+SOME_JOBS_SPEC = (
+    ("24371655", "COMPLETED", {}),
+    ("24371656", "PENDING", {}),
+    ("24371657", "RUNNING", {}),
+    ("24371658", "CANCELLED", {"Elapsed": "00:00:00"}),
+    (
+        "24371659",
+        "TIMEOUT",
+        {"REQMEM": "2Gn", "TotalCPU": "00:04:00", "Elapsed": "00:21:00"},
+    ),
+    ("24371660", "OTHER", {"REQMEM": "2Gn", "Elapsed": "00:12:05"}),
+)
+
+# expected fields of each some_jobs table row
+FORMAT_JOBS_FIELDS = (
+    ("JobID", "State", "Elapsed", "CPUEff", "REQMEM", "TimeEff"),
+    ("24371655", "COMPLETED", "00:10:00", "90.0%", "1Gn", "50.0%"),
+    ("24371656", "PENDING", "---", "---", "---", "---"),
+    ("24371657", "RUNNING", "00:10:00", "---", "1Gn", "50.0%"),
+    ("24371658", "CANCELLED", "00:00:00", "---", "1Gn", "0.0%"),
+    ("24371659", "TIMEOUT", "00:21:00", "19.0%", "2Gn", "105.0%"),
+    ("24371660", "OTHER", "00:12:05", "74.5%", "2Gn", "60.4%"),
+)
+
+# expected rows of the multi node tables, split on whitespace once at collection
+MULTI_NODE_LINES = (
+    "JobID State CPUEff TimeEff MemEff GPUEff GPUMem",
+    "8205464 FAILED 6.2% 0.0% 0.0% --- ---",
+    "8189521 CANCELLED 10.5% 83.0% 26.0% 5.5% 30.1%",
+    "8189521 CANCELLED 10.5% 83.0% 26.3% 3.5% 30.1%",
+    "8197399 COMPLETED 95.4% 21.1% 9.5% 29.4% 99.8%",
+    "8205048 COMPLETED 4.6% 4.1% 1.1% --- ---",
+    "39889258_1426 COMPLETED 99.7% 76.7% 3.6% --- ---",
+)
+
+MULTI_NODE_WITH_NODES_LINES = (
+    "JobID State CPUEff TimeEff MemEff GPUEff GPUMem",
+    "8205464 FAILED 6.2% 0.0% 0.0% --- ---",
+    "8189521 CANCELLED 10.5% 83.0% 26.0% 5.5% 30.1%",
+    "tiger-i19g10 10.5% 25.8% 7.5% 30.1%",
+    "tiger-i19g9 10.5% 26.3% 3.5% 30.1%",
+    "8189521 CANCELLED 10.5% 83.0% 26.3% 3.5% 30.1%",
+    "8197399 COMPLETED 95.4% 21.1% 9.5% 29.4% 99.8%",
+    "8205048 COMPLETED 4.6% 4.1% 1.1% --- ---",
+    "tiger-h19c1n15 18.6% 4.5%",
+    "tiger-h26c2n13 0.0% 0.0%",
+    "tiger-i26c2n11 0.0% 0.0%",
+    "tiger-i26c2n15 0.0% 0.0%",
+    "39889258_1426 COMPLETED 99.7% 76.7% 3.6% --- ---",
+)
+
+MULTI_NODE_WITH_NODES_AND_GPU_LINES = (
+    "JobID State CPUEff TimeEff MemEff GPUEff GPUMem",
+    "8205464 FAILED 6.2% 0.0% 0.0% --- ---",
+    "8189521 CANCELLED 10.5% 83.0% 26.0% 5.5% 30.1%",
+    "tiger-i19g10 10.5% 25.8% 7.5% 30.1%",
+    "0 7.5% 30.1%",
+    "1 7.5% 30.1%",
+    "2 7.2% 30.1%",
+    "3 7.8% 30.1%",
+    "tiger-i19g9 10.5% 26.3% 3.5% 30.1%",
+    "0 3.5% 30.1%",
+    "1 3.5% 30.1%",
+    "2 3.2% 30.1%",
+    "3 3.8% 30.1%",
+    "8189521 CANCELLED 10.5% 83.0% 26.3% 3.5% 30.1%",
+    "tiger-i19g9 10.5% 26.3% 3.5% 30.1%",
+    "0 3.5% 30.1%",
+    "1 3.5% 30.1%",
+    "2 3.2% 30.1%",
+    "3 3.8% 30.1%",
+    "8197399 COMPLETED 95.4% 21.1% 9.5% 29.4% 99.8%",
+    "tiger-i23g14 95.4% 9.5% 29.4% 99.8%",
+    "3 29.4% 99.8%",
+    "8205048 COMPLETED 4.6% 4.1% 1.1% --- ---",
+    "tiger-h19c1n15 18.6% 4.5%",
+    "tiger-h26c2n13 0.0% 0.0%",
+    "tiger-i26c2n11 0.0% 0.0%",
+    "tiger-i26c2n15 0.0% 0.0%",
+    "39889258_1426 COMPLETED 99.7% 76.7% 3.6% --- ---",
+)
+
+
+def assert_columns(columns, expected):
+    """Columns hold the space separated names, in any order."""
+    assert sorted(columns) == sorted(expected.split())
+
+
+def strip_ansi_lines(text):
+    """Remove color codes from rendered output and split it into lines."""
+    return ANSI_ESCAPE.sub("", text).split("\n")
+
 
 @pytest.fixture()
 def renderer():
@@ -19,112 +125,20 @@ def renderer():
     return output_renderer.OutputRenderer(min_required)
 
 
-@pytest.fixture()
+@pytest.fixture(scope="session")
 def some_jobs():
-    """A few test jobs for generating an output table."""
+    """A few test jobs for generating an output table, built once per session."""
     jobs = []
-    job = job_module.Job("24371655", "24371655", None)
-    job.update(
-        {
-            "JobID": "24371655",
-            "State": "COMPLETED",
-            "AllocCPUS": "1",
-            "REQMEM": "1Gn",
-            "TotalCPU": "00:09:00",
-            "Elapsed": "00:10:00",
-            "Timelimit": "00:20:00",
-            "MaxRSS": "",
-            "NNodes": "1",
-            "NTasks": "",
-        }
-    )
-    jobs.append(job)
-    job = job_module.Job("24371656", "24371656", None)
-    job.update(
-        {
-            "JobID": "24371656",
-            "State": "PENDING",
-            "AllocCPUS": "1",
-            "REQMEM": "1Gn",
-            "TotalCPU": "00:09:00",
-            "Elapsed": "00:10:00",
-            "Timelimit": "00:20:00",
-            "MaxRSS": "",
-            "NNodes": "1",
-            "NTasks": "",
-        }
-    )
-    jobs.append(job)
-    job = job_module.Job("24371657", "24371657", None)
-    job.update(
-        {
-            "JobID": "24371657",
-            "State": "RUNNING",
-            "AllocCPUS": "1",
-            "REQMEM": "1Gn",
-            "TotalCPU": "00:09:00",
-            "Elapsed": "00:10:00",
-            "Timelimit": "00:20:00",
-            "MaxRSS": "",
-            "NNodes": "1",
-            "NTasks": "",
-        }
-    )
-    jobs.append(job)
-    job = job_module.Job("24371658", "24371658", None)
-    job.update(
-        {
-            "JobID": "24371658",
-            "State": "CANCELLED",
-            "AllocCPUS": "1",
-            "REQMEM": "1Gn",
-            "TotalCPU": "00:09:00",
-            "Elapsed": "00:00:00",
-            "Timelimit": "00:20:00",
-            "MaxRSS": "",
-            "NNodes": "1",
-            "NTasks": "",
-        }
-    )
-    jobs.append(job)
-    job = job_module.Job("24371659", "24371659", None)
-    job.update(
-        {
-            "JobID": "24371659",
-            "State": "TIMEOUT",
-            "AllocCPUS": "1",
-            "REQMEM": "2Gn",
-            "TotalCPU": "00:04:00",
-            "Elapsed": "00:21:00",
-            "Timelimit": "00:20:00",
-            "MaxRSS": "",
-            "NNodes": "1",
-            "NTasks": "",
-        }
-    )
-    jobs.append(job)
-    job = job_module.Job("24371660", "24371660", None)
-    job.update(
-        {
-            "JobID": "24371660",
-            "State": "OTHER",
-            "AllocCPUS": "1",
-            "REQMEM": "2Gn",
-            "TotalCPU": "00:09:00",
-            "Elapsed": "00:12:05",
-            "Timelimit": "00:20:00",
-            "MaxRSS": "",
-            "NNodes": "1",
-            "NTasks": "",
-        }
-    )
-    jobs.append(job)
+    for jobid, state, overrides in SOME_JOBS_SPEC:
+        job = job_module.Job(jobid, jobid, None)
+        job.update({"JobID": jobid, "State": state, **SOME_JOBS_BASE, **overrides})
+        jobs.append(job)
     return jobs
 
 
-@pytest.fixture()
+@pytest.fixture(scope="session")
 def gpu_jobs(single_gpu, multi_gpu, multi_node_multi_gpu):
-    """A collection of jobs with gpus."""
+    """A collection of jobs with gpus, built once per session."""
     jobs = []
 
     job = job_module.Job("8189521", "8189521", None)
@@ -145,9 +159,9 @@ def gpu_jobs(single_gpu, multi_gpu, multi_node_multi_gpu):
     return jobs
 
 
-@pytest.fixture()
+@pytest.fixture(scope="session")
 def cpu_jobs(single_core, multi_node, short_job):
-    """A collection of cpu jobs."""
+    """A collection of cpu jobs, built once per session."""
     jobs = []
 
     job = job_module.Job("8205464", "8205464", None)
@@ -168,9 +182,9 @@ def cpu_jobs(single_core, multi_node, short_job):
     return jobs
 
 
-@pytest.fixture()
+@pytest.fixture(scope="session")
 def some_multi_core_jobs(gpu_jobs, cpu_jobs):
-    """A collection of jobs with multiple cores/gpus."""
+    """A collection of jobs with multiple cores/gpus, built once per session."""
     result = []
     result.append(cpu_jobs[0])
     result += gpu_jobs
@@ -187,24 +201,21 @@ def test_renderer_init(renderer):
         output_renderer.ColumnFormatter("CPUEff"),
         output_renderer.ColumnFormatter("MemEff"),
     ]
-    assert sorted(renderer.query_columns) == sorted(
+    assert_columns(
+        renderer.query_columns,
         (
             "JobID JobIDRaw State Elapsed TotalCPU "
             "AllocCPUS REQMEM NNodes NTasks MaxRSS AdminComment"
-        ).split()
+        ),
     )
 
     renderer = output_renderer.OutputRenderer(min_required, "")
     assert renderer.formatters == []
-    assert sorted(renderer.query_columns) == sorted(
-        ("JobID JobIDRaw State AdminComment").split()
-    )
+    assert_columns(renderer.query_columns, "JobID JobIDRaw State AdminComment")
 
     renderer = output_renderer.OutputRenderer(min_required, "TotalCPU%<5")
     assert renderer.formatters == [output_renderer.ColumnFormatter("TotalCPU%<5")]
-    assert sorted(renderer.query_columns) == sorted(
-        ("JobID JobIDRaw State TotalCPU AdminComment").split()
-    )
+    assert_columns(renderer.query_columns, "JobID JobIDRaw State TotalCPU AdminComment")
 
 
 def test_renderer_build_formatters():
@@ -244,63 +255,60 @@ def test_renderer_validate_formatters(renderer):
     assert renderer.formatters[2].width == 10
 
 
-def test_renderer_validate_formatters_with_node(renderer):
+@pytest.mark.parametrize(
+    ("node", "gpu", "format_str", "expected_return", "expected_formatters"),
+    [
+        # normal function
+        (False, False, "State", ["State"], ["State"]),
+        # add in job id
+        (True, False, "State", ["State"], ["JobID", "State"]),
+        # add in both gpus, gpu implies node
+        (True, True, "State", ["State"], ["JobID", "State", "GPUEff", "GPUMem"]),
+        # since format already has jobid and gpumem, will not override
+        (
+            True,
+            True,
+            "GPUMEM,State,JobID:>",
+            ["GPUMem", "State", "JobID"],
+            ["GPUMem", "State", "JobID"],
+        ),
+    ],
+)
+def test_renderer_validate_formatters_with_node(
+    node, gpu, format_str, expected_return, expected_formatters
+):
     """Validating formatters with GPUs can alter formatters."""
     min_gpu = [*min_required, "GPU", "GPUEff", "GPUMem"]
-    # normal function
-    renderer.node = False
-    renderer.gpu = False
-    renderer.formatters = output_renderer.build_formatters("State")
-    assert renderer.validate_formatters(min_gpu) == ["State"]
-    assert renderer.formatters == ["State"]
-
-    # add in job id
-    renderer.node = True
-    renderer.gpu = False
-    renderer.formatters = output_renderer.build_formatters("State")
-    assert renderer.validate_formatters(min_gpu) == ["State"]
-    assert renderer.formatters == ["JobID", "State"]
-
-    # add in both gpus, gpu implies node
-    renderer.node = True
-    renderer.gpu = True
-    renderer.formatters = output_renderer.build_formatters("State")
-    assert renderer.validate_formatters(min_gpu) == ["State"]
-    assert renderer.formatters == ["JobID", "State", "GPUEff", "GPUMem"]
-    assert renderer.formatters[0].alignment == "<"  # switched by node reporting
-
-    # since format already has jobid and gpumem, will not override
-    renderer.node = True
-    renderer.gpu = True
-    renderer.formatters = output_renderer.build_formatters("GPUMEM,State,JobID:>")
-    assert renderer.validate_formatters(min_gpu) == "GPUMem State JobID".split()
-    assert renderer.formatters == ["GPUMem", "State", "JobID"]
-    assert renderer.formatters[2].alignment == "<"  # switched by node reporting
+    renderer = output_renderer.OutputRenderer(min_required, node=node, gpu=gpu)
+    renderer.formatters = output_renderer.build_formatters(format_str)
+    assert renderer.validate_formatters(min_gpu) == expected_return
+    assert renderer.formatters == expected_formatters
+    if node:
+        # switched by node reporting
+        jobid = renderer.formatters[expected_formatters.index("JobID")]
+        assert jobid.alignment == "<"
 
 
 def test_renderer_correct_columns(renderer):
     """Corrected columns include required entries and derived values."""
     renderer.query_columns = ["JobID"]
     renderer.correct_columns()
-    assert sorted(renderer.query_columns) == sorted(
-        "JobID JobIDRaw State AdminComment".split()
-    )
+    assert_columns(renderer.query_columns, "JobID JobIDRaw State AdminComment")
 
     renderer.query_columns = "JobID CPUEff MemEff TimeEff".split()
     renderer.correct_columns()
-    assert sorted(renderer.query_columns) == sorted(
+    assert_columns(
+        renderer.query_columns,
         (
             "JobID TotalCPU Elapsed REQMEM"
             " JobIDRaw State AdminComment"
             " NNodes NTasks AllocCPUS MaxRSS Timelimit"
-        ).split()
+        ),
     )
 
     renderer.query_columns = "JobID JobID JobID".split()
     renderer.correct_columns()
-    assert sorted(renderer.query_columns) == sorted(
-        "JobID JobIDRaw State AdminComment".split()
-    )
+    assert_columns(renderer.query_columns, "JobID JobIDRaw State AdminComment")
 
 
 def test_renderer_format_jobs(some_jobs):
@@ -309,9 +317,8 @@ def test_renderer_format_jobs(some_jobs):
         min_required, "JobID,State,Elapsed,CPUEff,REQMEM,TimeEff"
     )
     result = renderer.format_jobs(some_jobs)
-    ansi_escape = re.compile(r"\x1B[@-_][0-?]*[ -/]*[@-~]")
     # check removed codes
-    codes = ansi_escape.findall(result)
+    codes = ANSI_ESCAPE.findall(result)
     for code in codes[1::2]:  # normal
         assert code == "\x1b[0m"
     for code in codes[0:10:20]:
@@ -326,106 +333,29 @@ def test_renderer_format_jobs(some_jobs):
         assert codes[i] == "\x1b[34m"  # blue
     for i in (18,):
         assert codes[i] == "\x1b[36m"  # cyan
-    # remove color codes
-    result = ansi_escape.sub("", result)
-    lines = result.split("\n")
-    assert lines[0].split() == "JobID State Elapsed CPUEff REQMEM TimeEff".split()
-    assert lines[1].split() == "24371655 COMPLETED 00:10:00 90.0% 1Gn 50.0%".split()
-    assert lines[2].split() == "24371656 PENDING --- --- --- ---".split()
-    assert lines[3].split() == "24371657 RUNNING 00:10:00 --- 1Gn 50.0%".split()
-    assert lines[4].split() == "24371658 CANCELLED 00:00:00 --- 1Gn 0.0%".split()
-    assert lines[5].split() == "24371659 TIMEOUT 00:21:00 19.0% 2Gn 105.0%".split()
-    assert lines[6].split() == "24371660 OTHER 00:12:05 74.5% 2Gn 60.4%".split()
-
-
-def test_renderer_format_jobs_multi_node(some_multi_core_jobs):
-    """Can render output as table with colored entries."""
-    renderer = output_renderer.OutputRenderer(
-        min_required,
-        "JobID,State,CPUEff,TimeEff,MemEff,GPU",
-    )
-    result = renderer.format_jobs(some_multi_core_jobs)
-    ansi_escape = re.compile(r"\x1B[@-_][0-?]*[ -/]*[@-~]")
-    result = ansi_escape.sub("", result)
-    lines = result.split("\n")
-    assert lines[0].split() == "JobID State CPUEff TimeEff MemEff GPUEff GPUMem".split()
-    assert lines[1].split() == "8205464 FAILED 6.2% 0.0% 0.0% --- ---".split()
-    assert lines[2].split() == "8189521 CANCELLED 10.5% 83.0% 26.0% 5.5% 30.1%".split()
-    assert lines[3].split() == "8189521 CANCELLED 10.5% 83.0% 26.3% 3.5% 30.1%".split()
-    assert lines[4].split() == "8197399 COMPLETED 95.4% 21.1% 9.5% 29.4% 99.8%".split()
-    assert lines[5].split() == "8205048 COMPLETED 4.6% 4.1% 1.1% --- ---".split()
-    assert (
-        lines[6].split() == "39889258_1426 COMPLETED 99.7% 76.7% 3.6% --- ---".split()
-    )
-
-
-def test_renderer_format_jobs_multi_node_with_nodes(some_multi_core_jobs):
-    """Can render output as table with colored entries."""
+    lines = strip_ansi_lines(result)
+    assert tuple(tuple(line.split()) for line in lines[:7]) == FORMAT_JOBS_FIELDS
+
+
+@pytest.mark.parametrize(
+    ("node", "gpu", "expected"),
+    [
+        (node, gpu, [line.split() for line in lines])
+        for node, gpu, lines in (
+            (False, False, MULTI_NODE_LINES),
+            (True, False, MULTI_NODE_WITH_NODES_LINES),
+            (True, True, MULTI_NODE_WITH_NODES_AND_GPU_LINES),
+        )
+    ],
+)
+def test_renderer_format_jobs_multi_node(some_multi_core_jobs, node, gpu, expected):
+    """Can render multi node jobs, optionally split by node and gpu."""
     renderer = output_renderer.OutputRenderer(
-        min_required,
-        "JobID,State,CPUEff,TimeEff,MemEff,GPU",
-        node=True,
+        min_required, "JobID,State,CPUEff,TimeEff,MemEff,GPU", node=node, gpu=gpu
     )
     result = renderer.format_jobs(some_multi_core_jobs)
-    ansi_escape = re.compile(r"\x1B[@-_][0-?]*[ -/]*[@-~]")
-    result = ansi_escape.sub("", result)
-    lines = result.split("\n")
-    assert lines[0].split() == "JobID State CPUEff TimeEff MemEff GPUEff GPUMem".split()
-    assert lines[1].split() == "8205464 FAILED 6.2% 0.0% 0.0% --- ---".split()
-    assert lines[2].split() == "8189521 CANCELLED 10.5% 83.0% 26.0% 5.5% 30.1%".split()
-    assert lines[3].split() == "tiger-i19g10 10.5% 25.8% 7.5% 30.1%".split()
-    assert lines[4].split() == "tiger-i19g9 10.5% 26.3% 3.5% 30.1%".split()
-    assert lines[5].split() == "8189521 CANCELLED 10.5% 83.0% 26.3% 3.5% 30.1%".split()
-    assert lines[6].split() == "8197399 COMPLETED 95.4% 21.1% 9.5% 29.4% 99.8%".split()
-    assert lines[7].split() == "8205048 COMPLETED 4.6% 4.1% 1.1% --- ---".split()
-    assert lines[8].split() == "tiger-h19c1n15 18.6% 4.5%".split()
-    assert lines[9].split() == "tiger-h26c2n13 0.0% 0.0%".split()
-    assert lines[10].split() == "tiger-i26c2n11 0.0% 0.0%".split()
-    assert lines[11].split() == "tiger-i26c2n15 0.0% 0.0%".split()
-    assert (
-        lines[12].split() == "39889258_1426 COMPLETED 99.7% 76.7% 3.6% --- ---".split()
-    )
-
-
-def test_renderer_format_jobs_multi_node_with_nodes_and_gpu(some_multi_core_jobs):
-    """Can render output as table with colored entries."""
-    renderer = output_renderer.OutputRenderer(
-        min_required, "JobID,State,CPUEff,TimeEff,MemEff,GPU", node=True, gpu=True
-    )
-    result = renderer.format_jobs(some_multi_core_jobs)
-    ansi_escape = re.compile(r"\x1B[@-_][0-?]*[ -/]*[@-~]")
-    result = ansi_escape.sub("", result)
-    lines = result.split("\n")
-    assert lines[0].split() == "JobID State CPUEff TimeEff MemEff GPUEff GPUMem".split()
-    assert lines[1].split() == "8205464 FAILED 6.2% 0.0% 0.0% --- ---".split()
-    assert lines[2].split() == "8189521 CANCELLED 10.5% 83.0% 26.0% 5.5% 30.1%".split()
-    assert lines[3].split() == "tiger-i19g10 10.5% 25.8% 7.5% 30.1%".split()
-    assert lines[4].split() == "0 7.5% 30.1%".split()
-    assert lines[5].split() == "1 7.5% 30.1%".split()
-    assert lines[6].split() == "2 7.2% 30.1%".split()
-    assert lines[7].split() == "3 7.8% 30.1%".split()
-    assert lines[8].split() == "tiger-i19g9 10.5% 26.3% 3.5% 30.1%".split()
-    assert lines[9].split() == "0 3.5% 30.1%".split()
-    assert lines[10].split() == "1 3.5% 30.1%".split()
-    assert lines[11].split() == "2 3.2% 30.1%".split()
-    assert lines[12].split() == "3 3.8% 30.1%".split()
-    assert lines[13].split() == "8189521 CANCELLED 10.5% 83.0% 26.3% 3.5% 30.1%".split()
-    assert lines[14].split() == "tiger-i19g9 10.5% 26.3% 3.5% 30.1%".split()
-    assert lines[15].split() == "0 3.5% 30.1%".split()
-    assert lines[16].split() == "1 3.5% 30.1%".split()
-    assert lines[17].split() == "2 3.2% 30.1%".split()
-    assert lines[18].split() == "3 3.8% 30.1%".split()
-    assert lines[19].split() == "8197399 COMPLETED 95.4% 21.1% 9.5% 29.4% 99.8%".split()
-    assert lines[20].split() == "tiger-i23g14 95.4% 9.5% 29.4% 99.8%".split()
-    assert lines[21].split() == "3 29.4% 99.8%".split()
-    assert lines[22].split() == "8205048 COMPLETED 4.6% 4.1% 1.1% --- ---".split()
-    assert lines[23].split() == "tiger-h19c1n15 18.6% 4.5%".split()
-    assert lines[24].split() == "tiger-h26c2n13 0.0% 0.0%".split()
-    assert lines[25].split() == "tiger-i26c2n11 0.0% 0.0%".split()
-    assert lines[26].split() == "tiger-i26c2n15 0.0% 0.0%".split()
-    assert (
-        lines[27].split() == "39889258_1426 COMPLETED 99.7% 76.7% 3.6% --- ---".split()
-    )
+    lines = strip_ansi_lines(result)
+    assert [line.split() for line in lines[: len(expected)]] == expected
 
 
 def test_format_jobs_empty(some_jobs):
@@ -455,75 +385,52 @@ def test_format_jobs_single_str(some_jobs):
     ]
 
 
-def test_formatter_init():
+@pytest.mark.parametrize(
+    ("token", "alignment", "width", "has_end"),
+    [
+        ("test", "^", None, False),  # simple name
+        ("test%>", ">", None, False),  # with alignment
+        ("test%10", "^", 10, False),  # with width
+        ("test%<10", "<", 10, False),  # with both
+        ("test%20e", "^", 20, True),  # can specify end with width
+        ("test:20$", "^", 20, True),  # can use alternate tokens : and $
+    ],
+)
+def test_formatter_init(token, alignment, width, has_end):
     """Column formatter parses format tokens correctly."""
-    # simple name
-    result = output_renderer.ColumnFormatter("test")
+    result = output_renderer.ColumnFormatter(token)
     assert result.title == "test"
-    assert result.alignment == "^"
-    assert result.width is None
-
-    # with alignment
-    result = output_renderer.ColumnFormatter("test%>")
-    assert result.title == "test"
-    assert result.alignment == ">"
-    assert result.width is None
-
-    # with width
-    result = output_renderer.ColumnFormatter("test%10")
-    assert result.title == "test"
-    assert result.alignment == "^"
-    assert result.width == 10
-
-    # with both
-    result = output_renderer.ColumnFormatter("test%<10")
-    assert result.title == "test"
-    assert result.alignment == "<"
-    assert result.width == 10
-    assert result.end is None
-
-    # with invalid width
-    with pytest.raises(ValueError, match="Unable to parse format token 'test%1<0'"):
-        result = output_renderer.ColumnFormatter("test%1<0")
-
-    # empty
-    with pytest.raises(ValueError, match="Unable to parse format token ''"):
-        result = output_renderer.ColumnFormatter("")
-
-    # if unable to parse with %, recommend using ""
-    with pytest.raises(
-        ValueError,
-        match=(
+    assert result.alignment == alignment
+    assert result.width == width
+    assert (result.end is not None) == has_end
+
+
+@pytest.mark.parametrize(
+    ("token", "match"),
+    [
+        # with invalid width
+        ("test%1<0", "Unable to parse format token 'test%1<0'"),
+        # empty
+        ("", "Unable to parse format token ''"),
+        # if unable to parse with %, recommend using ""
+        (
+            "test%a",
             "Unable to parse format token 'test%a', "
-            "did you forget to wrap in quotes?"
+            "did you forget to wrap in quotes?",
         ),
-    ):
-        result = output_renderer.ColumnFormatter("test%a")
-
-    # if unable to parse with %, recommend using "" even when matching
-    with pytest.raises(
-        ValueError,
-        match="Unable to parse format token 'test%', did you forget to wrap in quotes?",
-    ):
-        result = output_renderer.ColumnFormatter("test%")
-
-    # end without width is an error
-    with pytest.raises(ValueError, match="Unable to parse format token 'test%e'"):
-        result = output_renderer.ColumnFormatter("test%e")
-
-    # can specify end with width
-    result = output_renderer.ColumnFormatter("test%20e")
-    assert result.title == "test"
-    assert result.alignment == "^"
-    assert result.width == 20
-    assert result.end is not None
-
-    # can use alternate tokens : and $
-    result = output_renderer.ColumnFormatter("test:20$")
-    assert result.title == "test"
-    assert result.alignment == "^"
-    assert result.width == 20
-    assert result.end is not None
+        # if unable to parse with %, recommend using "" even when matching
+        (
+            "test%",
+            "Unable to parse format token 'test%', did you forget to wrap in quotes?",
+        ),
+        # end without width is an error
+        ("test%e", "Unable to parse format token 'test%e'"),
+    ],
+)
+def test_formatter_init_invalid(token, match):
+    """Column formatter rejects invalid format tokens."""
+    with pytest.raises(ValueError, match=match):
+        output_renderer.ColumnFormatter(token)
 
 
 def test_formatter_eq():
@@ -582,6 +489,11 @@ def test_formatter_compute_width():
     fmt.compute_width(jobs)
     assert fmt.width == 12
 
+    # no jobs uses the title and border
+    fmt = output_renderer.ColumnFormatter("JobID")
+    fmt.compute_width([])
+    assert fmt.width == 7
+
 
 def test_formatter_format_entry():
     """Can format entry with alignment, width, and color."""